@@ -9,66 +9,147 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import aiohttp
 from homeassistant.const import Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.loader import async_get_loaded_integration
 
 from .api import (
     SpaceApiClient,
     SpaceApiClientError,
+    SpaceApiClientSettings,
+    parse_projection,
     validate_and_sanitize_api_key,
     validate_and_sanitize_host_url,
 )
-from .const import CONF_API_KEY, CONF_HOST, DOMAIN, LOGGER, SCAN_INTERVAL
-from .coordinator import SpaceApiDataUpdateCoordinator
+from .const import (
+    CONF_API_KEY,
+    CONF_CONNECT_TIMEOUT,
+    CONF_FIELDS,
+    CONF_HOST,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_PROJECTION,
+    CONF_READ_TIMEOUT,
+    CONF_TOTAL_TIMEOUT,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_RESPONSE_SIZE_KIB,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_TOTAL_TIMEOUT,
+    DOMAIN,
+    LOGGER,
+)
+from .coordinator import (
+    SpaceApiDataUpdateCoordinator,
+    async_release_host_coordinator,
+    async_subscribe_host_coordinator,
+)
 from .data import SpaceApiData
+from .extractor import parse_extractors
+from .session import async_acquire_session, async_release_session
+from .store import SpaceApiStore
+from .webhook import async_register_webhook
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from .data import SpaceApiConfigEntry
+    from .extractor import FieldExtractor
 
 
 def _platforms_for(entry_data: dict) -> list[Platform]:
     """Return the platforms that should be loaded for this entry."""
-    platforms: list[Platform] = [Platform.BINARY_SENSOR]
+    platforms: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
     if entry_data.get(CONF_API_KEY):
         platforms.append(Platform.SWITCH)
     return platforms
 
 
+def _client_settings(
+    entry: SpaceApiConfigEntry, extractors: tuple[FieldExtractor, ...]
+) -> SpaceApiClientSettings:
+    """Build the client settings from the entry options."""
+    options = entry.options
+    projection = parse_projection(options.get(CONF_PROJECTION))
+    if projection:
+        # Keep the fields the extractors read.
+        projection += tuple(extractor.projection_path for extractor in extractors)
+    return SpaceApiClientSettings(
+        max_response_size=int(
+            options.get(CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_SIZE_KIB) * 1024
+        ),
+        projection=projection,
+        timeout=aiohttp.ClientTimeout(
+            total=options.get(CONF_TOTAL_TIMEOUT, DEFAULT_TOTAL_TIMEOUT),
+            sock_connect=options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+            sock_read=options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        ),
+    )
+
+
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: SpaceApiConfigEntry,
 ) -> bool:
     """Set up this integration using UI."""
+    store = SpaceApiStore(hass, entry.entry_id)
+    await store.async_load()
+    extractors = parse_extractors(entry.options.get(CONF_FIELDS))
+
     coordinator = SpaceApiDataUpdateCoordinator(
         hass=hass,
         logger=LOGGER,
         name=DOMAIN,
-        update_interval=SCAN_INTERVAL,
+        # Polling happens on the shared per-host coordinator.
+        update_interval=None,
         config_entry=entry,
+        always_update=False,
     )
     entry.runtime_data = SpaceApiData(
         client=SpaceApiClient(
             host_url=entry.data[CONF_HOST],
-            session=async_get_clientsession(hass),
+            session=async_acquire_session(hass, entry),
             api_key=entry.data.get(CONF_API_KEY),
+            endpoint=store.endpoint(entry.data[CONF_HOST]),
+            settings=_client_settings(entry, extractors),
         ),
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
+        host_coordinator=async_subscribe_host_coordinator(hass, entry),
+        store=store,
+        extractors=extractors,
     )
+    # With a seed the first refresh below needs no request, so startup does
+    # not wait for the host.
+    seeded_from_store = coordinator.async_seed_host()
+    coordinator.async_attach_host()
 
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup failed, so async_unload_entry will not run for this attempt.
+        await async_release_host_coordinator(hass, entry)
+        await async_release_session(hass, entry)
+        raise
+
+    # Start (or stop) the host's push stream to match this entry's options.
+    entry.runtime_data.host_coordinator.async_update_push()
 
     await hass.config_entries.async_forward_entry_setups(
         entry, _platforms_for(entry.data)
     )
 
+    async_register_webhook(hass, entry)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
+    if seeded_from_store:
+        # The persisted document may be old: fetch the live one right away.
+        entry.async_create_background_task(
+            hass,
+            entry.runtime_data.host_coordinator.async_refresh(),
+            f"{DOMAIN} refresh {entry.entry_id}",
+        )
+
     return True
 
 
@@ -77,9 +158,21 @@ async def async_unload_entry(
     entry: SpaceApiConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(
+    unload_ok = await hass.config_entries.async_unload_platforms(
         entry, _platforms_for(entry.data)
     )
+    if unload_ok:
+        await async_release_host_coordinator(hass, entry)
+        await async_release_session(hass, entry)
+    return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: SpaceApiConfigEntry,
+) -> None:
+    """Delete the persisted state of a removed entry."""
+    await SpaceApiStore(hass, entry.entry_id).async_remove()
 
 
 async def async_reload_entry(
@@ -3,18 +3,105 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import random
 import re
 import socket
-from typing import Any
-from urllib.parse import urlparse
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse, urlunparse
 
 import aiohttp
+from aiohttp import hdrs
 
-from .const import LOGGER
+from .const import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_TOTAL_TIMEOUT,
+    LOGGER,
+)
+from .metrics import SpaceApiMetrics
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - Home Assistant ships orjson
+    orjson = None
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Mapping
 
 # Constants
 MAX_API_KEY_LENGTH = 256
 
+# Endpoint identifiers for sticky endpoint discovery
+ENDPOINT_PRIMARY = "primary"
+ENDPOINT_FALLBACK = "fallback"
+
+# Bounds (seconds) of the backoff between re-probes of /api/space while the
+# direct host URL is the one serving the space state.
+PRIMARY_REPROBE_BACKOFF_MIN = 600.0
+PRIMARY_REPROBE_BACKOFF_MAX = 6 * 3600.0
+
+# Retries of idempotent GETs after transient failures (connection resets,
+# read timeouts, 502/503/504 from a proxy): at most RETRY_ATTEMPTS requests
+# with full-jitter exponential backoff. POSTs and connect timeouts (a host
+# that is down) are never retried. A whole poll (every attempt, and the
+# second endpoint in read-only mode) ends after RETRY_DEADLINE seconds: each
+# attempt's total timeout is capped to the time left.
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_MAX = 4.0
+RETRY_DEADLINE = 15.0
+RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+# First contact in read-only mode races /api/space against the direct host
+# URL: the host URL request starts after this stagger (seconds) unless
+# /api/space has already answered or failed.
+RACE_STAGGER = 0.3
+
+# Server-Sent Events stream next to /api/space. The server is expected to send
+# at least a keep-alive comment within the read timeout.
+PUSH_PATH = "/api/space/events"
+PUSH_CONNECT_TIMEOUT = 10
+PUSH_READ_TIMEOUT = 120
+
+# Request timeouts (aiohttp.ClientTimeout semantics, defaults from const.py):
+# connecting to a dead host fails fast while a slow but healthy one may still
+# stream a large body. The second request of a primary/fallback pair goes to
+# the same host right after the first failed, so it only gets a short connect
+# window.
+FALLBACK_CONNECT_TIMEOUT = 1.0
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(
+    total=DEFAULT_TOTAL_TIMEOUT,
+    sock_connect=DEFAULT_CONNECT_TIMEOUT,
+    sock_read=DEFAULT_READ_TIMEOUT,
+)
+
+# Bounded body reads: documents above the limit are aborted while streaming.
+DEFAULT_MAX_RESPONSE_SIZE = 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+# Subtrees every projection keeps, because the entities read them.
+REQUIRED_PROJECTION_PATHS = ("space", "state")
+_PROJECTION_PATH_PATTERN = re.compile(r"^[A-Za-z0-9_]+(\.[A-Za-z0-9_]+)*$")
+
+# Circuit breaker: consecutive failed polls before the host is considered
+# down, and bounds (seconds) of the wait before a half-open trial request.
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_TIMEOUT_MIN = 30.0
+BREAKER_RESET_TIMEOUT_MAX = 1800.0
+
 
 class SpaceApiClientError(Exception):
     """Exception to indicate a general API error."""
@@ -32,6 +119,214 @@ class SpaceApiClientAuthenticationError(
     """Exception to indicate an authentication error."""
 
 
+class SpaceApiClientRateLimitedError(
+    SpaceApiClientCommunicationError,
+):
+    """Exception to indicate the server asked us to slow down (HTTP 429)."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize with the server's Retry-After, in seconds, if any."""
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class SpaceApiClientCircuitOpenError(
+    SpaceApiClientCommunicationError,
+):
+    """Exception to indicate a request was skipped because the host is down."""
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Parsed body and cache validators from the last 200 response for a URL."""
+
+    payload: Any
+    etag: str | None
+    last_modified: str | None
+
+
+def default_json_decoder() -> Callable[[bytes], Any]:
+    """Return the fastest available JSON decoder (orjson, else stdlib json)."""
+    if orjson is not None:
+        return orjson.loads
+    return json.loads
+
+
+@dataclass(frozen=True, slots=True)
+class SpaceApiClientSettings:
+    """Per-entry tuning of how the client fetches and keeps documents."""
+
+    max_response_size: int = DEFAULT_MAX_RESPONSE_SIZE
+    projection: tuple[str, ...] = ()
+    timeout: aiohttp.ClientTimeout = DEFAULT_TIMEOUT
+    # Any callable turning bytes into Python objects and raising ValueError on
+    # bad input; None picks default_json_decoder().
+    decoder: Callable[[bytes], Any] | None = None
+
+
+class CircuitState(StrEnum):
+    """States of a CircuitBreaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a host is down instead of waiting for every timeout.
+
+    After BREAKER_FAILURE_THRESHOLD consecutive communication failures the
+    circuit opens and requests raise SpaceApiClientCircuitOpenError without
+    touching the network. Once the reset timeout has passed the circuit is
+    half-open: a single trial request goes out. Success closes the circuit;
+    failure opens it again with a doubled reset timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT_MIN,
+        max_reset_timeout: float = BREAKER_RESET_TIMEOUT_MAX,
+    ) -> None:
+        """Initialize a closed circuit."""
+        self._failure_threshold = failure_threshold
+        self._min_reset_timeout = reset_timeout
+        self._max_reset_timeout = max_reset_timeout
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened = False
+        self._retry_at = 0.0
+        self._trial_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state of the circuit."""
+        if not self._opened:
+            return CircuitState.CLOSED
+        if time.monotonic() >= self._retry_at:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next trial request (0 if allowed now)."""
+        if not self._opened:
+            return 0.0
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def before_request(self) -> None:
+        """Raise SpaceApiClientCircuitOpenError if the request must not go out."""
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return
+        if state is CircuitState.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        self.rejected += 1
+        msg = f"Host is unreachable, next attempt in {self.retry_in:.0f} s"
+        raise SpaceApiClientCircuitOpenError(msg)
+
+    def record_success(self) -> None:
+        """Close the circuit after the host answered."""
+        if self._opened:
+            LOGGER.info("Host is reachable again, closing circuit")
+        self._failures = 0
+        self._opened = False
+        self._trial_in_flight = False
+        self._reset_timeout = self._min_reset_timeout
+
+    def record_failure(self) -> None:
+        """Count a failed request; open the circuit when the host looks down."""
+        self._failures += 1
+        if self._opened:
+            # The half-open trial failed.
+            self._reset_timeout = min(self._reset_timeout * 2, self._max_reset_timeout)
+        elif self._failures < self._failure_threshold:
+            return
+        else:
+            self.times_opened += 1
+        self._opened = True
+        self._trial_in_flight = False
+        self._retry_at = time.monotonic() + self._reset_timeout
+        LOGGER.debug(
+            "Opened circuit after %s failures, next trial in %.0f s",
+            self._failures,
+            self._reset_timeout,
+        )
+
+    def release(self) -> None:
+        """Give up a trial slot whose request ended without an outcome."""
+        self._trial_in_flight = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "retry_in": round(self.retry_in, 1),
+            "reset_timeout": self._reset_timeout,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+
+def _is_transient(exception: SpaceApiClientError) -> bool:
+    """Return True if a failed request is worth repeating as is."""
+    cause = exception.__cause__
+    if isinstance(cause, aiohttp.ConnectionTimeoutError):
+        # Nothing accepted the connection; another try would wait as long.
+        return False
+    if isinstance(cause, TimeoutError):
+        return True
+    if isinstance(cause, aiohttp.ClientResponseError):
+        return cause.status in RETRY_STATUSES
+    if isinstance(cause, aiohttp.ClientSSLError):
+        return False
+    # Connection refused/reset, server disconnected mid-response.
+    return isinstance(cause, aiohttp.ClientConnectionError)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return the seconds to wait from a Retry-After header (delay or date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # HTTP dates are always GMT.
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def parse_max_age(headers: Mapping[str, str]) -> float | None:
+    """Return the remaining freshness of a response from Cache-Control."""
+    cache_control = headers.get(hdrs.CACHE_CONTROL)
+    if not cache_control:
+        return None
+    max_age: float | None = None
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        name = name.lower()
+        if name in ("no-cache", "no-store"):
+            return None
+        if name == "max-age" and value.strip('" ').isdigit():
+            max_age = float(value.strip('" '))
+    if max_age is None:
+        return None
+    age = headers.get(hdrs.AGE, "")
+    if age.strip().isdigit():
+        max_age -= float(age)
+    return max(0.0, max_age)
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Verify that the response is valid."""
     if response.status in (401, 403):
@@ -39,6 +334,10 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
         raise SpaceApiClientAuthenticationError(
             msg,
         )
+    if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+        retry_after = parse_retry_after(response.headers.get(hdrs.RETRY_AFTER))
+        msg = "Rate limited by the server"
+        raise SpaceApiClientRateLimitedError(msg, retry_after)
     response.raise_for_status()
 
 
@@ -79,6 +378,71 @@ def validate_and_sanitize_host_url(host_url: str) -> str:
     return host_url.rstrip("/")
 
 
+def is_space_document(payload: Any) -> bool:
+    """Return True if the payload looks like a SpaceAPI document."""
+    if not isinstance(payload, dict):
+        return False
+    state = payload.get("state")
+    return isinstance(state, dict) and isinstance(state.get("open"), bool)
+
+
+def parse_projection(value: str | None) -> tuple[str, ...]:
+    """Parse a comma separated list of dotted paths into a projection."""
+    if not value:
+        return ()
+    paths = tuple(path.strip() for path in value.split(",") if path.strip())
+    invalid = [path for path in paths if not _PROJECTION_PATH_PATTERN.match(path)]
+    if invalid:
+        msg = f"Invalid projection path(s): {', '.join(invalid)}"
+        raise SpaceApiClientError(msg)
+    return paths
+
+
+def project_document(payload: Any, paths: Iterable[str]) -> Any:
+    """Return a copy of the document holding only the given dotted paths."""
+    if not isinstance(payload, dict):
+        return payload
+    result: dict[str, Any] = {}
+    for path in paths:
+        source: Any = payload
+        target = result
+        *parents, leaf = path.split(".")
+        for key in parents:
+            if not isinstance(source, dict) or key not in source:
+                break
+            source = source[key]
+            if target.get(key) is source:
+                # A shorter path already copied this whole subtree.
+                break
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            target = target[key]
+        else:
+            if isinstance(source, dict) and leaf in source:
+                target[leaf] = source[leaf]
+    return result
+
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_host_key(host_url: str) -> str:
+    """Return a canonical form of a host URL, used to share one poller per host."""
+    parsed = urlparse(validate_and_sanitize_host_url(host_url))
+    scheme = parsed.scheme.lower()
+    netloc = (parsed.hostname or "").rstrip(".")
+    if ":" in netloc:
+        netloc = f"[{netloc}]"
+    try:
+        port = parsed.port
+    except ValueError as exception:
+        msg = f"Invalid port: {exception}"
+        raise SpaceApiClientError(msg) from exception
+    if port and port != _DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+    return urlunparse((scheme, netloc, parsed.path.rstrip("/"), "", parsed.query, ""))
+
+
 _CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x1F\x7F-\x9F]")
 
 
@@ -121,42 +485,290 @@ class SpaceApiClient:
         host_url: str,
         session: aiohttp.ClientSession,
         api_key: str | None = None,
+        endpoint: str | None = None,
+        settings: SpaceApiClientSettings | None = None,
     ) -> None:
         """Initialize SpaceAPI Client."""
         # Validate and sanitize inputs
         self._host_url = validate_and_sanitize_host_url(host_url)
         self._api_key = validate_and_sanitize_api_key(api_key)
         self._session = session
+        self._settings = settings or SpaceApiClientSettings()
+        self._decode = self._settings.decoder or default_json_decoder()
+        timeout = self._settings.timeout
+        self._fallback_timeout = aiohttp.ClientTimeout(
+            total=timeout.total,
+            sock_read=timeout.sock_read,
+            sock_connect=min(
+                timeout.sock_connect or FALLBACK_CONNECT_TIMEOUT,
+                FALLBACK_CONNECT_TIMEOUT,
+            ),
+        )
+        self._cache: dict[str, _CachedResponse] = {}
+        self._projection: tuple[str, ...] = ()
+        self.projection = self._settings.projection
+        self._not_modified = False
+        # Freshness (Cache-Control) and backoff (Retry-After) hints of the
+        # last poll, in seconds.
+        self._max_age: float | None = None
+        self._retry_after: float | None = None
+        # Monotonic time by which the running poll must be done.
+        self._poll_deadline: float | None = None
+        # Shared by every client of the same host once the entry is attached
+        # to its host coordinator.
+        self.breaker = CircuitBreaker()
+        # Request timings and transport counters for diagnostics.
+        self.metrics = SpaceApiMetrics()
+        # Retry counters for diagnostics.
+        self.retry_stats = {"retries": 0, "recovered": 0, "exhausted": 0}
+
+        # Sticky endpoint discovery (read-only mode only). Once the direct
+        # host URL has proven to be the working one we go straight to it and
+        # re-probe /api/space only after an exponentially growing backoff.
+        self._endpoint = ENDPOINT_PRIMARY
+        # Nothing known about this host yet: race both endpoints.
+        self._first_contact = endpoint is None
+        self._reprobe_backoff = PRIMARY_REPROBE_BACKOFF_MIN
+        self._next_primary_probe = 0.0
+        if endpoint == ENDPOINT_FALLBACK and not self._api_key:
+            self._endpoint = ENDPOINT_FALLBACK
+            self._next_primary_probe = time.monotonic() + self._reprobe_backoff
+
+    @property
+    def not_modified(self) -> bool:
+        """Return True if the last GET was answered with 304 Not Modified."""
+        return self._not_modified
+
+    @property
+    def server_hint(self) -> float | None:
+        """Return how long the server asked us to wait before the next poll."""
+        if self._retry_after is not None:
+            return self._retry_after
+        return self._max_age
+
+    @property
+    def projection(self) -> tuple[str, ...]:
+        """Return the paths kept from fetched documents (empty keeps all)."""
+        return self._projection
+
+    @property
+    def configured_projection(self) -> tuple[str, ...]:
+        """Return the projection of this entry's options, never changed."""
+        return self._settings.projection
+
+    @projection.setter
+    def projection(self, paths: Iterable[str]) -> None:
+        """Change the projection; cached documents no longer match it."""
+        projection = tuple(sorted(set(paths)))
+        if projection:
+            projection = tuple(sorted({*projection, *REQUIRED_PROJECTION_PATHS}))
+        if projection != self._projection:
+            self._projection = projection
+            self._cache.clear()
+
+    @property
+    def endpoint(self) -> str:
+        """Return the endpoint that last served the space state."""
+        return self._endpoint
+
+    def _endpoint_url(self, endpoint: str) -> str:
+        """Return the URL for a primary/fallback endpoint identifier."""
+        if endpoint == ENDPOINT_FALLBACK:
+            return self._host_url
+        return f"{self._host_url}/api/space"
 
     async def async_get_space_state(self) -> Any:
-        """Get space state from the API."""
+        """Get space state from the API and record the poll's outcome."""
+        started = time.perf_counter()
         try:
+            data = await self._async_guarded_fetch()
+        except SpaceApiClientError:
+            self.metrics.record_poll(success=False, seconds=0.0)
+            raise
+        self.metrics.record_poll(success=True, seconds=time.perf_counter() - started)
+        return data
+
+    async def _async_guarded_fetch(self) -> Any:
+        """Get space state, failing fast while the host is down."""
+        self.breaker.before_request()
+        self._max_age = self._retry_after = None
+        self._poll_deadline = time.monotonic() + RETRY_DEADLINE
+        try:
+            data = await self._async_fetch_space_state()
+        except SpaceApiClientRateLimitedError as exception:
+            # The server answered; the coordinator backs off as asked.
+            self.breaker.record_success()
+            self._retry_after = exception.retry_after
+            raise
+        except SpaceApiClientAuthenticationError:
+            # The server answered; only the credentials are wrong.
+            self.breaker.record_success()
+            raise
+        except SpaceApiClientCommunicationError:
+            self.breaker.record_failure()
+            raise
+        finally:
+            self._poll_deadline = None
+            self.breaker.release()
+        self.breaker.record_success()
+        return data
+
+    async def _async_fetch_space_state(self) -> Any:
+        """Get space state from /api/space or, read-only, the host URL."""
+        # Fallback to a direct GET on the host URL only in read-only mode.
+        # When a key is configured the user expects API-server semantics, so
+        # we surface the original error instead of silently degrading.
+        if self._api_key:
             return await self._api_wrapper(
                 method="get",
-                url=f"{self._host_url}/api/space",
+                url=self._endpoint_url(ENDPOINT_PRIMARY),
             )
-        except SpaceApiClientAuthenticationError:
+
+        if self._first_contact:
+            return await self._async_race_endpoints()
+
+        if (
+            self._endpoint == ENDPOINT_FALLBACK
+            and time.monotonic() < self._next_primary_probe
+        ):
+            first, second = ENDPOINT_FALLBACK, ENDPOINT_PRIMARY
+        else:
+            first, second = ENDPOINT_PRIMARY, ENDPOINT_FALLBACK
+
+        try:
+            data = await self._api_wrapper(
+                method="get",
+                url=self._endpoint_url(first),
+            )
+        except (SpaceApiClientAuthenticationError, SpaceApiClientRateLimitedError):
+            # The server answered; asking the other endpoint would only hide
+            # the credentials problem or the Retry-After.
             raise
         except SpaceApiClientCommunicationError as exception:
-            # Fallback to a direct GET on the host URL only in read-only mode.
-            # When a key is configured the user expects API-server semantics, so
-            # we surface the original error instead of silently degrading.
-            if self._api_key:
-                raise
             LOGGER.debug(
-                "API endpoint /api/space failed, trying fallback to direct host_url"
+                "Endpoint %s failed, trying %s",
+                self._endpoint_url(first),
+                self._endpoint_url(second),
             )
             try:
-                return await self._api_wrapper(
+                data = await self._api_wrapper(
                     method="get",
-                    url=self._host_url,
+                    url=self._endpoint_url(second),
+                    client_timeout=self._fallback_timeout,
                 )
+            except SpaceApiClientRateLimitedError:
+                raise
             except SpaceApiClientError as fallback_exception:
                 msg = (
-                    f"Both /api/space ({exception}) and direct host fallback "
-                    f"({fallback_exception}) failed"
+                    f"Both {self._endpoint_url(first)} ({exception}) and "
+                    f"{self._endpoint_url(second)} ({fallback_exception}) failed"
                 )
                 raise SpaceApiClientCommunicationError(msg) from exception
+            self._learn_endpoint(second, primary_failed=first == ENDPOINT_PRIMARY)
+            return data
+
+        self._learn_endpoint(first, primary_failed=False)
+        return data
+
+    async def _async_race_endpoints(self) -> Any:
+        """
+        Race /api/space against the host URL; the first space document wins.
+
+        Happy-eyeballs style: the host URL request starts RACE_STAGGER after
+        /api/space, or right away once /api/space failed. The losing request
+        is cancelled and the winner is remembered like a sticky endpoint.
+        """
+        tasks: dict[asyncio.Task[Any], str] = {
+            asyncio.create_task(
+                self._api_wrapper(
+                    method="get", url=self._endpoint_url(ENDPOINT_PRIMARY)
+                )
+            ): ENDPOINT_PRIMARY
+        }
+        errors: dict[str, SpaceApiClientError] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=RACE_STAGGER if len(tasks) == 1 else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    endpoint = tasks[task]
+                    try:
+                        payload = task.result()
+                    except SpaceApiClientError as exception:
+                        errors[endpoint] = exception
+                        continue
+                    if is_space_document(payload):
+                        LOGGER.debug(
+                            "%s won the endpoint race", self._endpoint_url(endpoint)
+                        )
+                        self._first_contact = False
+                        self._learn_endpoint(
+                            endpoint, primary_failed=endpoint == ENDPOINT_FALLBACK
+                        )
+                        return payload
+                    errors[endpoint] = SpaceApiClientCommunicationError(
+                        "Not a SpaceAPI document"
+                    )
+                if len(tasks) == 1:
+                    fallback = asyncio.create_task(
+                        self._api_wrapper(
+                            method="get",
+                            url=self._endpoint_url(ENDPOINT_FALLBACK),
+                            client_timeout=self._fallback_timeout,
+                        )
+                    )
+                    tasks[fallback] = ENDPOINT_FALLBACK
+                    pending.add(fallback)
+        finally:
+            for task in pending:
+                task.cancel()
+            # Let cancelled requests release their connections.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        primary_error = errors.get(ENDPOINT_PRIMARY)
+        if isinstance(
+            primary_error,
+            SpaceApiClientAuthenticationError | SpaceApiClientRateLimitedError,
+        ):
+            raise primary_error
+        if isinstance(
+            fallback_error := errors.get(ENDPOINT_FALLBACK),
+            SpaceApiClientRateLimitedError,
+        ):
+            raise fallback_error
+        msg = (
+            f"Both {self._endpoint_url(ENDPOINT_PRIMARY)} ({primary_error}) and "
+            f"{self._endpoint_url(ENDPOINT_FALLBACK)} ({fallback_error}) failed"
+        )
+        raise SpaceApiClientCommunicationError(msg)
+
+    def _learn_endpoint(self, endpoint: str, *, primary_failed: bool) -> None:
+        """Remember which endpoint answered and schedule the next re-probe."""
+        if endpoint == ENDPOINT_FALLBACK:
+            self.metrics.fallback_hits += 1
+        if endpoint == ENDPOINT_PRIMARY:
+            if self._endpoint != ENDPOINT_PRIMARY:
+                LOGGER.debug("Endpoint /api/space is reachable again")
+            self._endpoint = ENDPOINT_PRIMARY
+            self._reprobe_backoff = PRIMARY_REPROBE_BACKOFF_MIN
+            return
+
+        if not primary_failed:
+            return
+        if self._endpoint == ENDPOINT_FALLBACK:
+            self._reprobe_backoff = min(
+                self._reprobe_backoff * 2, PRIMARY_REPROBE_BACKOFF_MAX
+            )
+        self._endpoint = ENDPOINT_FALLBACK
+        self._next_primary_probe = time.monotonic() + self._reprobe_backoff
+        LOGGER.debug(
+            "Using direct host URL, re-probing /api/space in %.0f s",
+            self._reprobe_backoff,
+        )
 
     async def async_set_space_state(self, *, open_state: bool) -> Any:
         """Set space state via the API."""
@@ -181,26 +793,152 @@ class SpaceApiClient:
             },
         )
 
+    async def async_stream_space_state(self) -> AsyncIterator[Any]:
+        """Yield the documents pushed by the server as Server-Sent Events."""
+        try:
+            async with self._session.request(
+                method="get",
+                url=f"{self._host_url}{PUSH_PATH}",
+                headers={hdrs.ACCEPT: "text/event-stream"},
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=PUSH_CONNECT_TIMEOUT,
+                    sock_read=PUSH_READ_TIMEOUT,
+                ),
+            ) as response:
+                _verify_response_or_raise(response)
+                data_lines: list[str] = []
+                async for raw_line in response.content:
+                    line = raw_line.decode("utf-8").rstrip("\r\n")
+                    if not line:
+                        # A blank line dispatches the event.
+                        if data_lines:
+                            yield self._decode("\n".join(data_lines).encode())
+                            data_lines = []
+                        continue
+                    field, _, value = line.partition(":")
+                    if field == "data":
+                        data_lines.append(value.removeprefix(" "))
+
+        except TimeoutError as exception:
+            msg = f"Timeout error reading event stream - {exception}"
+            raise SpaceApiClientCommunicationError(
+                msg,
+            ) from exception
+        except (aiohttp.ClientError, socket.gaierror) as exception:
+            msg = f"Error reading event stream - {exception}"
+            raise SpaceApiClientCommunicationError(
+                msg,
+            ) from exception
+        except ValueError as exception:
+            msg = f"Invalid event in stream - {exception}"
+            raise SpaceApiClientError(
+                msg,
+            ) from exception
+
     async def _api_wrapper(
         self,
         method: str,
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
+        client_timeout: aiohttp.ClientTimeout | None = None,
     ) -> Any:
-        """Get information from the API."""
-        try:
-            async with asyncio.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data,
+        """Send a request; GETs are retried after transient failures."""
+        if method != "get":
+            return await self._request(method, url, data, headers, client_timeout)
+
+        deadline = self._poll_deadline or time.monotonic() + RETRY_DEADLINE
+        attempt = 1
+        while True:
+            try:
+                result = await self._request(
+                    method,
+                    url,
+                    data,
+                    headers,
+                    self._attempt_timeout(client_timeout, deadline),
+                )
+            except SpaceApiClientError as exception:
+                if not _is_transient(exception):
+                    raise
+                backoff = min(
+                    RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** (attempt - 1)
                 )
+                delay = random.uniform(0, backoff)  # noqa: S311
+                if attempt >= RETRY_ATTEMPTS or time.monotonic() + delay >= deadline:
+                    if attempt > 1:
+                        self.retry_stats["exhausted"] += 1
+                    raise
+                LOGGER.debug("Retrying %s in %.2f s after: %s", url, delay, exception)
+                self.retry_stats["retries"] += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            if attempt > 1:
+                self.retry_stats["recovered"] += 1
+            return result
+
+    def _attempt_timeout(
+        self, client_timeout: aiohttp.ClientTimeout | None, deadline: float
+    ) -> aiohttp.ClientTimeout:
+        """Return the request timeout, its total capped to the time left."""
+        timeout = client_timeout or self._settings.timeout
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            msg = "Poll deadline exceeded"
+            raise SpaceApiClientCommunicationError(msg)
+        if timeout.total is not None and timeout.total <= remaining:
+            return timeout
+        return aiohttp.ClientTimeout(
+            total=remaining,
+            sock_connect=timeout.sock_connect,
+            sock_read=timeout.sock_read,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: dict | None,
+        headers: dict | None,
+        client_timeout: aiohttp.ClientTimeout | None,
+    ) -> Any:
+        """Send one request and decode the response."""
+        cached = self._cache.get(url) if method == "get" else None
+        if cached is not None:
+            headers = dict(headers or {})
+            if cached.etag:
+                headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+
+        self.metrics.requests += 1
+        try:
+            # The total timeout also bounds reading the body. The metrics are
+            # filled by the integration session's TraceConfig. Leaving the
+            # context releases the connection on every path, including
+            # errors and a cancelled race loser.
+            async with self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=data,
+                timeout=client_timeout or self._settings.timeout,
+                trace_request_ctx=self.metrics,
+            ) as response:
                 _verify_response_or_raise(response)
-                return await response.json()
+                if response.status == HTTPStatus.NOT_MODIFIED and cached is not None:
+                    # Nothing to decode: hand back the very same object so the
+                    # coordinator can detect "unchanged" by identity.
+                    self.metrics.not_modified += 1
+                    self._not_modified = True
+                    self._max_age = parse_max_age(response.headers)
+                    return cached.payload
+                return await self._decode_response(method, url, response)
 
         except TimeoutError as exception:
+            self.metrics.timeouts += 1
             msg = f"Timeout error fetching information - {exception}"
             raise SpaceApiClientCommunicationError(
                 msg,
@@ -210,8 +948,18 @@ class SpaceApiClient:
             raise SpaceApiClientCommunicationError(
                 msg,
             ) from exception
+        except ValueError as exception:
+            # Not JSON (e.g. an HTML page at /api/space): treat it like an
+            # unreachable endpoint so the read-only fallback still applies.
+            msg = f"Invalid JSON in response - {exception}"
+            raise SpaceApiClientCommunicationError(
+                msg,
+            ) from exception
+        except SpaceApiClientAuthenticationError:
+            self.metrics.auth_failures += 1
+            raise
         except SpaceApiClientError:
-            # Already shaped for the caller (e.g. auth error)
+            # Already shaped for the caller (e.g. rate limited)
             raise
         except asyncio.CancelledError:
             raise
@@ -220,3 +968,65 @@ class SpaceApiClient:
             raise SpaceApiClientError(
                 msg,
             ) from exception
+
+    async def _decode_response(
+        self, method: str, url: str, response: aiohttp.ClientResponse
+    ) -> Any:
+        """Decode a response body; GET documents are projected and cached."""
+        # The Content-Type is deliberately not checked: static hosts often
+        # serve spaceapi.json as text/plain or application/octet-stream.
+        started = time.perf_counter()
+        body = await self._read_body(response)
+        decode_started = time.perf_counter()
+        self.metrics.body.observe(decode_started - started)
+        self.metrics.bytes_received += len(body)
+        if method == "get":
+            payload = self._decode(body)
+        else:
+            # The server already acted on the request; a body that is empty or
+            # not JSON ("OK", an HTML page) leaves the caller to re-poll.
+            try:
+                payload = self._decode(body) if body.strip() else None
+            except ValueError:
+                LOGGER.debug("Ignoring undecodable %s response body", method.upper())
+                return None
+        self.metrics.decode.observe(time.perf_counter() - decode_started)
+        if method == "get":
+            self.metrics.last_payload_size = len(body)
+            if self._projection:
+                payload = project_document(payload, self._projection)
+            self._not_modified = False
+            self._max_age = parse_max_age(response.headers)
+            self._remember(url, response, payload)
+        return payload
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """Read the body in chunks, aborting as soon as it exceeds the limit."""
+        limit = self._settings.max_response_size
+        length = response.content_length
+        if length is not None and length > limit:
+            response.close()
+            msg = f"Response of {length} bytes exceeds the {limit} byte limit"
+            raise SpaceApiClientCommunicationError(msg)
+
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            body += chunk
+            if len(body) > limit:
+                response.close()
+                msg = f"Response exceeds the {limit} byte limit"
+                raise SpaceApiClientCommunicationError(msg)
+        return bytes(body)
+
+    def _remember(
+        self, url: str, response: aiohttp.ClientResponse, payload: Any
+    ) -> None:
+        """Store the validators of a 200 response for the next conditional GET."""
+        etag = response.headers.get(hdrs.ETAG)
+        last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+        if etag or last_modified:
+            self._cache[url] = _CachedResponse(
+                payload=payload, etag=etag, last_modified=last_modified
+            )
+        else:
+            self._cache.pop(url, None)
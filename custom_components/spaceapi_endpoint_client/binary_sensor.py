@@ -48,6 +48,8 @@ class SpaceApiBinarySensor(
 ):
     """Binary sensor reflecting the space's open/closed state."""
 
+    _watched_fields = ("open",)
+
     def __init__(
         self,
         coordinator: SpaceApiDataUpdateCoordinator,
@@ -63,4 +65,4 @@ class SpaceApiBinarySensor(
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
-        return self.coordinator.data.get("state", {}).get("open", False)
+        return self.coordinator.space_state.open
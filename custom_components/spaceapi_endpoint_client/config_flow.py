@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import secrets
 from typing import Any
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components import webhook
+from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.network import NoURLAvailableError
 from slugify import slugify
 
 from .api import (
@@ -15,10 +19,40 @@ from .api import (
     SpaceApiClientAuthenticationError,
     SpaceApiClientCommunicationError,
     SpaceApiClientError,
+    parse_projection,
     validate_and_sanitize_api_key,
     validate_and_sanitize_host_url,
 )
-from .const import CONF_API_KEY, CONF_HOST, DOMAIN, LOGGER
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_API_KEY,
+    CONF_CONNECT_TIMEOUT,
+    CONF_FIELDS,
+    CONF_HOST,
+    CONF_MAX_INTERVAL,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_MIN_INTERVAL,
+    CONF_PROJECTION,
+    CONF_PUSH,
+    CONF_READ_TIMEOUT,
+    CONF_STALE_GRACE,
+    CONF_TOTAL_TIMEOUT,
+    CONF_WEBHOOK,
+    CONF_WEBHOOK_ID,
+    CONF_WEBHOOK_SECRET,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MAX_RESPONSE_SIZE_KIB,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_STALE_GRACE,
+    DEFAULT_TOTAL_TIMEOUT,
+    DOMAIN,
+    LOGGER,
+    WEBHOOK_SECRET_HEADER,
+)
+from .coordinator import async_remember_probe
+from .extractor import parse_extractors
 
 
 def _user_schema(host_default: Any, api_key_default: Any) -> vol.Schema:
@@ -46,11 +80,98 @@ def _reauth_schema() -> vol.Schema:
     )
 
 
+def _seconds_selector(minimum: int, maximum: int) -> selector.NumberSelector:
+    """Build a number box for an interval/timeout in seconds."""
+    return selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=1,
+            unit_of_measurement="s",
+            mode=selector.NumberSelectorMode.BOX,
+        ),
+    )
+
+
+def _options_schema(options: dict[str, Any]) -> vol.Schema:
+    """Build the options form schema with the current options as defaults."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_ADAPTIVE_POLLING,
+                default=options.get(CONF_ADAPTIVE_POLLING, False),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_MIN_INTERVAL,
+                default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+            ): _seconds_selector(10, 3600),
+            vol.Required(
+                CONF_MAX_INTERVAL,
+                default=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+            ): _seconds_selector(10, 86400),
+            vol.Required(
+                CONF_STALE_GRACE,
+                default=options.get(CONF_STALE_GRACE, DEFAULT_STALE_GRACE),
+            ): _seconds_selector(0, 86400),
+            vol.Required(
+                CONF_PUSH,
+                default=options.get(CONF_PUSH, False),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_WEBHOOK,
+                default=options.get(CONF_WEBHOOK, False),
+            ): selector.BooleanSelector(),
+            vol.Required(
+                CONF_MAX_RESPONSE_SIZE,
+                default=options.get(
+                    CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_SIZE_KIB
+                ),
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=16,
+                    max=16384,
+                    step=1,
+                    unit_of_measurement="KiB",
+                    mode=selector.NumberSelectorMode.BOX,
+                ),
+            ),
+            vol.Required(
+                CONF_CONNECT_TIMEOUT,
+                default=options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+            ): _seconds_selector(1, 60),
+            vol.Required(
+                CONF_READ_TIMEOUT,
+                default=options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+            ): _seconds_selector(1, 300),
+            vol.Required(
+                CONF_TOTAL_TIMEOUT,
+                default=options.get(CONF_TOTAL_TIMEOUT, DEFAULT_TOTAL_TIMEOUT),
+            ): _seconds_selector(1, 600),
+            vol.Optional(
+                CONF_PROJECTION,
+                description={"suggested_value": options.get(CONF_PROJECTION, "")},
+            ): selector.TextSelector(),
+            vol.Optional(
+                CONF_FIELDS,
+                description={"suggested_value": options.get(CONF_FIELDS, "")},
+            ): selector.TextSelector(selector.TextSelectorConfig(multiline=True)),
+        },
+    )
+
+
 class SpaceApiFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for the SpaceAPI Endpoint Client integration."""
 
     VERSION = 2
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004 — required by HA but unused
+    ) -> SpaceApiOptionsFlow:
+        """Return the options flow for this handler."""
+        return SpaceApiOptionsFlow()
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -217,9 +338,85 @@ class SpaceApiFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self, host_url: str, api_key: str | None = None
     ) -> None:
         """Validate credentials by reading the space state."""
+        # Home Assistant's shared session: a probe must not leave its own
+        # connector behind.
         client = SpaceApiClient(
             host_url=host_url,
-            session=async_create_clientsession(self.hass),
+            session=async_get_clientsession(self.hass),
             api_key=api_key or "",
         )
-        await client.async_get_space_state()
+        payload = await client.async_get_space_state()
+        async_remember_probe(self.hass, host_url, api_key, payload)
+
+
+class SpaceApiOptionsFlow(config_entries.OptionsFlow):
+    """Options flow for the SpaceAPI Endpoint Client integration."""
+
+    _options: dict[str, Any]
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the polling options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            if user_input[CONF_MIN_INTERVAL] > user_input[CONF_MAX_INTERVAL]:
+                errors[CONF_MAX_INTERVAL] = "invalid_interval_bounds"
+            if user_input[CONF_TOTAL_TIMEOUT] < max(
+                user_input[CONF_CONNECT_TIMEOUT], user_input[CONF_READ_TIMEOUT]
+            ):
+                errors[CONF_TOTAL_TIMEOUT] = "invalid_timeouts"
+            try:
+                parse_projection(user_input.get(CONF_PROJECTION))
+            except SpaceApiClientError:
+                errors[CONF_PROJECTION] = "invalid_projection"
+            try:
+                parse_extractors(user_input.get(CONF_FIELDS))
+            except SpaceApiClientError:
+                errors[CONF_FIELDS] = "invalid_fields"
+
+            if not errors and user_input.get(CONF_WEBHOOK):
+                current = self.config_entry.options
+                self._options = {
+                    **user_input,
+                    # Keep an existing webhook stable across option edits.
+                    CONF_WEBHOOK_ID: current.get(CONF_WEBHOOK_ID)
+                    or webhook.async_generate_id(),
+                    CONF_WEBHOOK_SECRET: current.get(CONF_WEBHOOK_SECRET)
+                    or secrets.token_urlsafe(32),
+                }
+                return await self.async_step_webhook()
+            if not errors:
+                return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=_options_schema(user_input or dict(self.config_entry.options)),
+            errors=errors,
+        )
+
+    async def async_step_webhook(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Show the webhook URL and secret before saving."""
+        if user_input is not None:
+            return self.async_create_entry(data=self._options)
+
+        webhook_id = self._options[CONF_WEBHOOK_ID]
+        try:
+            webhook_url = webhook.async_generate_url(self.hass, webhook_id)
+        except NoURLAvailableError:
+            webhook_url = webhook.async_generate_path(webhook_id)
+
+        return self.async_show_form(
+            step_id="webhook",
+            data_schema=vol.Schema({}),
+            description_placeholders={
+                "webhook_url": webhook_url,
+                "secret_header": WEBHOOK_SECRET_HEADER,
+                "secret": self._options[CONF_WEBHOOK_SECRET],
+            },
+        )
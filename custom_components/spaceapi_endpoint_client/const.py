@@ -12,6 +12,77 @@ CONF_API_KEY = "api_key"
 
 SCAN_INTERVAL = timedelta(minutes=1)
 
+# Adaptive polling (options flow). Bounds are in seconds.
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+DEFAULT_MIN_INTERVAL = 30
+DEFAULT_MAX_INTERVAL = 900
+# Share of the time since state.lastchange we are willing to wait between
+# polls, e.g. a space closed for five hours is polled every 30 minutes.
+ADAPTIVE_LASTCHANGE_FACTOR = 0.1
+
+# Push mode (options flow): state arrives over a Server-Sent Events stream and
+# polling drops to a long safety interval while the stream is up.
+CONF_PUSH = "push"
+PUSH_SAFETY_INTERVAL = timedelta(minutes=15)
+PUSH_RECONNECT_MIN = 1.0
+PUSH_RECONNECT_MAX = 300.0
+
+# Grace window (seconds, options flow) during which failed polls keep serving
+# the last good data before the entities go unavailable. 0 disables it.
+CONF_STALE_GRACE = "stale_grace"
+DEFAULT_STALE_GRACE = 300
+
+# Inbound webhook (options flow). The id and secret are generated when the
+# webhook is enabled and kept in the entry options.
+CONF_WEBHOOK = "webhook"
+CONF_WEBHOOK_ID = "webhook_id"
+CONF_WEBHOOK_SECRET = "webhook_secret"  # noqa: S105 — option key, not a secret
+WEBHOOK_SECRET_HEADER = "X-Webhook-Secret"  # noqa: S105 — header name
+
+# Response handling (options flow). The size limit is in KiB; the projection
+# is a comma separated list of dotted paths kept in coordinator.data.
+CONF_MAX_RESPONSE_SIZE = "max_response_size"
+CONF_PROJECTION = "projection"
+DEFAULT_MAX_RESPONSE_SIZE_KIB = 1024
+
+# Request timeouts in seconds (options flow), passed to aiohttp.ClientTimeout
+# as sock_connect, sock_read and total.
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_READ_TIMEOUT = "read_timeout"
+CONF_TOTAL_TIMEOUT = "total_timeout"
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 10
+DEFAULT_TOTAL_TIMEOUT = 30
+
+# User-defined field extractors (options flow): JSONPath-like selectors, one
+# per line, each exposed as a sensor. Compiled once per entry setup.
+CONF_FIELDS = "fields"
+
+# Integration-owned connection pool shared by all entries. Idle connections
+# are kept a little longer than the default poll interval, so each poll
+# reuses a warm (TLS) connection instead of opening a new one. The per-host
+# limit leaves room for a push stream and a switch POST next to the poll.
+POOL_LIMIT = 100
+POOL_LIMIT_PER_HOST = 4
+POOL_DNS_CACHE_TTL = 300
+POOL_KEEPALIVE_TIMEOUT = SCAN_INTERVAL.total_seconds() + 15
+
+# Integration-wide cap on polls in flight (request and JSON decode). Hosts
+# also poll at a fixed offset within their interval, so entries loaded
+# together do not stay in phase.
+MAX_CONCURRENT_POLLS = 8
+
+# How long (seconds) a document fetched by the config flow is reused for the
+# first refresh of the entry it creates.
+PROBE_CACHE_TTL = 60
+
+# Per-entry persistent storage (helpers.storage.Store)
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
 # Window we wait between POSTing a state change and re-polling, so the
 # SpaceAPI server has time to commit the write before our refresh reads it.
+# Only used when the POST response does not carry the new state.
 API_SETTLE_DELAY = 0.5
@@ -2,26 +2,640 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import random
+import time
+import zlib
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
 from .api import (
+    CircuitBreaker,
     SpaceApiClientAuthenticationError,
     SpaceApiClientError,
+    is_space_document,
+    normalize_host_key,
+    project_document,
 )
+from .const import (
+    ADAPTIVE_LASTCHANGE_FACTOR,
+    CONF_ADAPTIVE_POLLING,
+    CONF_API_KEY,
+    CONF_HOST,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PUSH,
+    CONF_STALE_GRACE,
+    CONF_WEBHOOK,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEFAULT_STALE_GRACE,
+    DOMAIN,
+    LOGGER,
+    MAX_CONCURRENT_POLLS,
+    PROBE_CACHE_TTL,
+    PUSH_RECONNECT_MAX,
+    PUSH_RECONNECT_MIN,
+    PUSH_SAFETY_INTERVAL,
+    SCAN_INTERVAL,
+)
+from .data import SpaceState
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
 
-# https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
-class SpaceApiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Class to manage fetching data from the API."""
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+    from .api import SpaceApiClient
+    from .data import SpaceApiConfigEntry
+
+DATA_HOST_COORDINATORS: HassKey[dict[str, SpaceApiHostCoordinator]] = HassKey(
+    f"{DOMAIN}_host_coordinators"
+)
+
+# Documents fetched by the config flow, keyed by (host key, API key), so
+# setting up the entry right afterwards does not fetch them again.
+DATA_PROBE_CACHE: HassKey[dict[tuple[str, str], tuple[float, Any]]] = HassKey(
+    f"{DOMAIN}_probe_cache"
+)
+
+# Shared by every host coordinator to bound the polls in flight.
+DATA_POLL_LIMITER: HassKey[asyncio.Semaphore] = HassKey(f"{DOMAIN}_poll_limiter")
+
+# Cap on the doubling exponent so the backoff arithmetic stays small.
+_MAX_BACKOFF_EXPONENT = 16
+
+
+def adaptive_interval(
+    min_interval: timedelta,
+    max_interval: timedelta,
+    unchanged_polls: int,
+    stable_for: timedelta,
+) -> timedelta:
+    """Return the next poll interval for a space whose state is stable."""
+    backoff = min_interval * (2 ** min(unchanged_polls, _MAX_BACKOFF_EXPONENT))
+    target = max(backoff, stable_for * ADAPTIVE_LASTCHANGE_FACTOR)
+    return max(min_interval, min(target, max_interval))
+
+
+def poll_phase(host_key: str) -> float:
+    """Return the host's fixed position within its interval, in [0, 1)."""
+    # crc32 rather than hash(): str hashes are salted per process, and the
+    # offset should survive restarts.
+    return zlib.crc32(host_key.encode()) / 2**32
+
+
+def phase_aligned_delay(now: float, interval: float, phase: float) -> float:
+    """
+    Return the delay to the poll slot nearest to one interval from now.
+
+    Slots lie at ``phase * interval`` modulo the interval, so hosts with
+    different phases are spread across it. The delay stays within half an
+    interval of the nominal one.
+    """
+    target = now + interval
+    shift = (phase * interval - target) % interval
+    if shift > interval / 2:
+        shift -= interval
+    return interval + shift
+
+
+def _open_state(data: dict[str, Any] | None) -> bool | None:
+    """Return state.open of a SpaceAPI document, or None if unknown."""
+    if not isinstance(data, dict):
+        return None
+    state = data.get("state")
+    if not isinstance(state, dict):
+        return None
+    return state.get("open")
+
+
+def _stable_for(data: dict[str, Any]) -> timedelta:
+    """Return how long the space has been in its current state."""
+    state = data.get("state")
+    lastchange = state.get("lastchange") if isinstance(state, dict) else None
+    if not isinstance(lastchange, int | float) or isinstance(lastchange, bool):
+        return timedelta(0)
+    return max(
+        timedelta(0), timedelta(seconds=dt_util.utcnow().timestamp() - lastchange)
+    )
+
+
+class SpaceApiHostCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Poll one SpaceAPI host on behalf of every entry pointing at it."""
+
+    def __init__(self, hass: HomeAssistant, host_key: str) -> None:
+        """Initialize the shared coordinator for a normalized host."""
+        super().__init__(
+            hass,
+            LOGGER,
+            name=f"{DOMAIN} ({host_key})",
+            update_interval=SCAN_INTERVAL,
+            # Not owned by a single entry; subscribers map failures themselves.
+            config_entry=None,
+            always_update=False,
+        )
+        self.host_key = host_key
+        self.entries: list[SpaceApiConfigEntry] = []
+        # The entry whose key the server rejected on the last poll, if any.
+        self.auth_failed_entry: SpaceApiConfigEntry | None = None
+        self._unchanged_polls = 0
+        self._push_task: asyncio.Task[None] | None = None
+        self._push_connected = False
+        self._poll_listeners: list[CALLBACK_TYPE] = []
+        # Nominal interval; update_interval holds the delay to the next slot.
+        self.poll_interval = SCAN_INTERVAL
+        self.phase = poll_phase(host_key)
+        self._limiter = hass.data.setdefault(
+            DATA_POLL_LIMITER, asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+        )
+        # One breaker per host, shared by the clients of all its entries.
+        self.breaker = CircuitBreaker()
+
+    @property
+    def push_connected(self) -> bool:
+        """Return True while state updates arrive over the push stream."""
+        return self._push_connected
+
+    def _adaptive_bounds(self) -> tuple[timedelta, timedelta] | None:
+        """Return the (min, max) interval, or None when polling is fixed."""
+        if not self.entries or not all(
+            entry.options.get(CONF_ADAPTIVE_POLLING) for entry in self.entries
+        ):
+            return None
+        # Honor the most demanding subscriber of this host.
+        return (
+            min(
+                timedelta(
+                    seconds=entry.options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+                )
+                for entry in self.entries
+            ),
+            min(
+                timedelta(
+                    seconds=entry.options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
+                )
+                for entry in self.entries
+            ),
+        )
+
+    @callback
+    def async_reset_adaptive_interval(self) -> None:
+        """Poll at the minimum interval again, e.g. after a local switch action."""
+        self._unchanged_polls = 0
+        if (bounds := self._adaptive_bounds()) is not None:
+            self.poll_interval = bounds[0]
+            # A state applied right after the action reschedules the next poll
+            # from update_interval, so it has to be tightened now as well.
+            self._async_align_next_poll()
+
+    def _base_interval(self) -> timedelta:
+        """Return the interval to poll at when nothing is known yet."""
+        if (bounds := self._adaptive_bounds()) is not None:
+            return bounds[0]
+        return SCAN_INTERVAL
+
+    def _adapt_interval(self, data: dict[str, Any]) -> None:
+        """Stretch the interval while the state is stable, tighten on change."""
+        if self._push_connected or any(
+            entry.options.get(CONF_WEBHOOK) for entry in self.entries
+        ):
+            # State is delivered to us; polling is only a safety net.
+            self.poll_interval = PUSH_SAFETY_INTERVAL
+            return
+        if (bounds := self._adaptive_bounds()) is None:
+            self.poll_interval = SCAN_INTERVAL
+            return
+        if self.data is not None and _open_state(self.data) == _open_state(data):
+            self._unchanged_polls += 1
+        else:
+            self._unchanged_polls = 0
+        self.poll_interval = adaptive_interval(
+            bounds[0], bounds[1], self._unchanged_polls, _stable_for(data)
+        )
+
+    @callback
+    def async_update_push(self) -> None:
+        """Start or stop the push stream to match the subscribers' options."""
+        wanted = any(entry.options.get(CONF_PUSH) for entry in self.entries)
+        if wanted and self._push_task is None:
+            self._push_task = self.hass.async_create_background_task(
+                self._async_push_loop(), name=f"{DOMAIN} push ({self.host_key})"
+            )
+        elif not wanted and self._push_task is not None:
+            self._push_task.cancel()
+            self._push_task = None
+            self._push_connected = False
+
+    async def async_shutdown(self) -> None:
+        """Cancel the push stream along with the scheduled polls."""
+        if self._push_task is not None:
+            self._push_task.cancel()
+            self._push_task = None
+        await super().async_shutdown()
+
+    async def _async_push_loop(self) -> None:
+        """Consume the push stream, reconnecting with jittered backoff."""
+        backoff = PUSH_RECONNECT_MIN
+        while True:
+            client = self._polling_entry().runtime_data.client
+            try:
+                async for payload in client.async_stream_space_state():
+                    data = self._merge_server_state(payload)
+                    if data is None:
+                        LOGGER.debug("Ignoring pushed event without space state")
+                        continue
+                    if not self._push_connected:
+                        LOGGER.debug("Push stream for %s connected", self.host_key)
+                        self._push_connected = True
+                        self.poll_interval = PUSH_SAFETY_INTERVAL
+                    backoff = PUSH_RECONNECT_MIN
+                    self.async_set_updated_data(data)
+            except SpaceApiClientError as exception:
+                LOGGER.debug("Push stream for %s failed: %s", self.host_key, exception)
+
+            if self._push_connected:
+                # Stream lost: poll right away and on the normal schedule until
+                # it is back.
+                LOGGER.debug("Push stream for %s lost, polling", self.host_key)
+                self._push_connected = False
+                self.poll_interval = self._base_interval()
+                await self.async_request_refresh()
+
+            await asyncio.sleep(backoff * random.uniform(0.5, 1.5))  # noqa: S311
+            backoff = min(backoff * 2, PUSH_RECONNECT_MAX)
+
+    @callback
+    def async_apply_server_state(self, payload: Any) -> bool:
+        """Apply a document or state object sent by the server, if usable."""
+        if (data := self._merge_server_state(payload)) is None:
+            return False
+        self.async_set_updated_data(data)
+        return True
+
+    def _merge_server_state(self, payload: Any) -> dict[str, Any] | None:
+        """Turn a full document or bare state object into coordinator data."""
+        if is_space_document(payload):
+            # Polled documents are projected by the client; documents the
+            # server sends on its own are projected here.
+            if projection := self._projection():
+                return project_document(payload, projection)
+            return payload
+        if (
+            isinstance(payload, dict)
+            and isinstance(payload.get("open"), bool)
+            and isinstance(self.data, dict)
+        ):
+            state = self.data.get("state")
+            return {
+                **self.data,
+                "state": {**(state if isinstance(state, dict) else {}), **payload},
+            }
+        return None
+
+    def _projection(self) -> tuple[str, ...]:
+        """Return the union of the subscribers' projections (empty keeps all)."""
+        # The configured projections: the polling client's projection is
+        # overwritten with this union on every poll.
+        projections = [
+            entry.runtime_data.client.configured_projection for entry in self.entries
+        ]
+        if not all(projections):
+            return ()
+        return tuple({path for projection in projections for path in projection})
+
+    @property
+    def polling_client(self) -> SpaceApiClient:
+        """Return the client that performs the shared GET (and its metrics)."""
+        return self._polling_entry().runtime_data.client
+
+    @callback
+    def async_add_poll_listener(self, poll_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """
+        Call back after every poll, failed or unchanged ones included.
+
+        Coordinator listeners are skipped when a poll changes nothing; the
+        health sensors want every poll.
+        """
+        self._poll_listeners.append(poll_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._poll_listeners.remove(poll_callback)
+
+        return remove_listener
+
+    def _polling_entry(self) -> SpaceApiConfigEntry:
+        """Pick the subscriber whose client performs the shared GET."""
+        # An entry with a key keeps API-server semantics (no silent fallback),
+        # so it wins over read-only entries for the same host.
+        for entry in self.entries:
+            if entry.data.get(CONF_API_KEY):
+                return entry
+        return self.entries[0]
+
+    def _max_interval(self) -> timedelta:
+        """Return the longest wait any subscriber accepts between polls."""
+        return min(
+            (
+                timedelta(
+                    seconds=entry.options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
+                )
+                for entry in self.entries
+            ),
+            default=timedelta(seconds=DEFAULT_MAX_INTERVAL),
+        )
+
+    @callback
+    def _async_align_next_poll(self) -> None:
+        """Schedule the next poll on this host's slot of the interval."""
+        delay = phase_aligned_delay(
+            self.hass.loop.time(), self.poll_interval.total_seconds(), self.phase
+        )
+        # Cache-Control max-age / Retry-After may stretch the wait up to the
+        # maximum interval, but never poll sooner than we otherwise would.
+        if self.entries and (hint := self.polling_client.server_hint):
+            delay = max(delay, min(hint, self._max_interval().total_seconds()))
+        # DataUpdateCoordinator reads update_interval when it schedules the
+        # next refresh, right after this update returns or raises.
+        self.update_interval = timedelta(seconds=delay)
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Update data via library."""
+        """Fetch the space state once for all subscribed entries."""
+        try:
+            async with self._limiter:
+                return await self._async_fetch()
+        finally:
+            self._async_align_next_poll()
+            for poll_callback in list(self._poll_listeners):
+                poll_callback()
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        """Fetch the document through the polling entry's client."""
+        entry = self._polling_entry()
+        client = entry.runtime_data.client
+        client.projection = self._projection()
+        self.auth_failed_entry = None
         try:
-            return await self.config_entry.runtime_data.client.async_get_space_state()
+            data = await client.async_get_space_state()
         except SpaceApiClientAuthenticationError as exception:
+            self.auth_failed_entry = entry
             raise ConfigEntryAuthFailed(str(exception)) from exception
         except SpaceApiClientError as exception:
             raise UpdateFailed(str(exception)) from exception
+
+        entry.runtime_data.store.async_set_endpoint(
+            entry.data[CONF_HOST], client.endpoint
+        )
+        self._adapt_interval(data)
+
+        # A 304 hands back the cached payload; returning the current data object
+        # lets the coordinator (built with always_update=False) skip the
+        # listener callbacks and therefore the entity state writes.
+        if client.not_modified and self.data is not None:
+            return self.data
+        return data
+
+
+@callback
+def async_remember_probe(
+    hass: HomeAssistant, host_url: str, api_key: str | None, payload: Any
+) -> None:
+    """Keep a config-flow probe result for the entry setup that follows."""
+    cache = hass.data.setdefault(DATA_PROBE_CACHE, {})
+    now = time.monotonic()
+    for key in [key for key, (expires, _) in cache.items() if expires <= now]:
+        del cache[key]
+    cache[(normalize_host_key(host_url), api_key or "")] = (
+        now + PROBE_CACHE_TTL,
+        payload,
+    )
+
+
+@callback
+def async_pop_probe(hass: HomeAssistant, host_url: str, api_key: str | None) -> Any:
+    """Return and forget a recent probe result, or None."""
+    cache = hass.data.get(DATA_PROBE_CACHE, {})
+    cached = cache.pop((normalize_host_key(host_url), api_key or ""), None)
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    return cached[1]
+
+
+@callback
+def async_subscribe_host_coordinator(
+    hass: HomeAssistant, entry: SpaceApiConfigEntry
+) -> SpaceApiHostCoordinator:
+    """Attach an entry to the shared coordinator of its host, creating it."""
+    host_key = normalize_host_key(entry.data[CONF_HOST])
+    registry = hass.data.setdefault(DATA_HOST_COORDINATORS, {})
+    if (host_coordinator := registry.get(host_key)) is None:
+        host_coordinator = registry[host_key] = SpaceApiHostCoordinator(hass, host_key)
+    host_coordinator.entries.append(entry)
+    return host_coordinator
+
+
+async def async_release_host_coordinator(
+    hass: HomeAssistant, entry: SpaceApiConfigEntry
+) -> None:
+    """Detach an entry and shut the shared coordinator down with the last one."""
+    entry.runtime_data.coordinator.async_detach_host()
+    host_coordinator = entry.runtime_data.host_coordinator
+    if entry not in host_coordinator.entries:
+        return
+    host_coordinator.entries.remove(entry)
+    if host_coordinator.entries:
+        host_coordinator.async_update_push()
+        return
+    registry = hass.data.get(DATA_HOST_COORDINATORS, {})
+    if registry.get(host_coordinator.host_key) is host_coordinator:
+        del registry[host_coordinator.host_key]
+    await host_coordinator.async_shutdown()
+
+
+# https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
+class SpaceApiDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Per-entry view of the data polled by the shared host coordinator."""
+
+    _unsub_host: Callable[[], None] | None = None
+    _unsub_grace: Callable[[], None] | None = None
+    _stale_since: datetime | None = None
+    _space_state: SpaceState | None = None
+    _space_state_source: dict[str, Any] | None = None
+
+    @property
+    def stale_since(self) -> datetime | None:
+        """Return since when polls fail and the last good data is served."""
+        return self._stale_since
+
+    @property
+    def space_state(self) -> SpaceState:
+        """Return the parsed space state, built once per fetched document."""
+        if self._space_state is None or self._space_state_source is not self.data:
+            self._space_state = SpaceState.from_document(self.data)
+            self._space_state_source = self.data
+        return self._space_state
+
+    @callback
+    def async_seed_host(self) -> bool:
+        """
+        Give the host coordinator a document to start from without a request.
+
+        A document the config flow just fetched is used as is. Otherwise the
+        last good document persisted for this entry is used; it may be stale,
+        so True is returned and the caller refreshes in the background.
+        """
+        entry = self.config_entry
+        host_coordinator = entry.runtime_data.host_coordinator
+        if host_coordinator.data is not None:
+            return False
+        host_url = entry.data[CONF_HOST]
+        stale = False
+        payload = async_pop_probe(self.hass, host_url, entry.data.get(CONF_API_KEY))
+        if payload is None:
+            payload = entry.runtime_data.store.payload(host_url)
+            stale = True
+        if payload is None:
+            return False
+        projection = entry.runtime_data.client.projection
+        if projection:
+            payload = project_document(payload, projection)
+        host_coordinator.async_set_updated_data(payload)
+        return stale
+
+    @callback
+    def async_attach_host(self) -> None:
+        """Start receiving the shared host coordinator's results."""
+        host_coordinator = self.config_entry.runtime_data.host_coordinator
+        self.config_entry.runtime_data.client.breaker = host_coordinator.breaker
+        self._unsub_host = host_coordinator.async_add_listener(self._handle_host_update)
+
+    @callback
+    def async_detach_host(self) -> None:
+        """Stop receiving the shared host coordinator's results."""
+        if self._unsub_host is not None:
+            self._unsub_host()
+            self._unsub_host = None
+        self._async_clear_stale()
+
+    @callback
+    def async_note_local_action(self) -> None:
+        """Tell the poller this entry just changed the state itself."""
+        self.config_entry.runtime_data.host_coordinator.async_reset_adaptive_interval()
+
+    @callback
+    def async_apply_server_state(self, payload: Any) -> bool:
+        """Apply a state returned by the server to every entry of the host."""
+        host_coordinator = self.config_entry.runtime_data.host_coordinator
+        return host_coordinator.async_apply_server_state(payload)
+
+    def _auth_failed(self, exception: Exception | None) -> bool:
+        """Return True when the shared poll was rejected with this entry's key."""
+        # The other subscribers never sent that key; for them it is a failed
+        # poll like any other.
+        return (
+            isinstance(exception, ConfigEntryAuthFailed)
+            and self.config_entry.runtime_data.host_coordinator.auth_failed_entry
+            is self.config_entry
+        )
+
+    @callback
+    def _handle_host_update(self) -> None:
+        """Fan a shared poll result out to this entry's entities."""
+        host_coordinator = self.config_entry.runtime_data.host_coordinator
+        if host_coordinator.last_update_success:
+            self._async_clear_stale()
+            self._async_persist(host_coordinator.data)
+            self.async_set_updated_data(host_coordinator.data)
+            return
+        exception = host_coordinator.last_exception
+        if self._auth_failed(exception):
+            self.config_entry.async_start_reauth(self.hass)
+        elif self._async_serve_stale():
+            return
+        elif isinstance(exception, ConfigEntryAuthFailed):
+            exception = UpdateFailed(str(exception))
+        self.async_set_update_error(exception or UpdateFailed("Update failed"))
+
+    @callback
+    def _async_serve_stale(self) -> bool:
+        """
+        Decide whether a failed poll may keep the last good data.
+
+        The first failure opens the grace window; until it expires entities
+        keep their state and the host coordinator keeps retrying, so a blip
+        causes no unavailable/available flapping.
+        """
+        if self.data is None or not self.last_update_success:
+            return False
+        grace = timedelta(
+            seconds=self.config_entry.options.get(CONF_STALE_GRACE, DEFAULT_STALE_GRACE)
+        )
+        now = dt_util.utcnow()
+        if self._stale_since is None:
+            if not grace:
+                return False
+            LOGGER.debug("Poll failed, serving last good data for up to %s", grace)
+            self._stale_since = now
+            self._unsub_grace = async_call_later(
+                self.hass, grace, self._async_grace_expired
+            )
+        return now < self._stale_since + grace
+
+    @callback
+    def _async_grace_expired(self, _now: datetime) -> None:
+        """Give up on the last good data if the host is still failing."""
+        self._unsub_grace = None
+        host_coordinator = self.config_entry.runtime_data.host_coordinator
+        if host_coordinator.last_update_success:
+            return
+        self.async_set_update_error(
+            host_coordinator.last_exception or UpdateFailed("Update failed")
+        )
+
+    @callback
+    def _async_clear_stale(self) -> None:
+        """Close the grace window after a successful poll."""
+        if self._unsub_grace is not None:
+            self._unsub_grace()
+            self._unsub_grace = None
+        self._stale_since = None
+
+    @callback
+    def _async_persist(self, data: dict[str, Any]) -> None:
+        """Keep the last good document to seed the entry after a restart."""
+        store = self.config_entry.runtime_data.store
+        store.async_set_payload(self.config_entry.data[CONF_HOST], data)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Update data via the shared host coordinator."""
+        host_coordinator = self.config_entry.runtime_data.host_coordinator
+        # Another entry for the same host already fetched the document, so the
+        # first refresh of this entry does not need a request of its own.
+        if (
+            self.data is None
+            and host_coordinator.last_update_success
+            and host_coordinator.data is not None
+        ):
+            self._async_persist(host_coordinator.data)
+            return host_coordinator.data
+
+        await host_coordinator.async_refresh()
+        if host_coordinator.last_update_success:
+            self._async_persist(host_coordinator.data)
+            return host_coordinator.data
+
+        exception = host_coordinator.last_exception
+        if self._auth_failed(exception):
+            raise ConfigEntryAuthFailed(str(exception)) from exception
+        if self._async_serve_stale():
+            return self.data
+        raise UpdateFailed(str(exception)) from exception
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
     from .api import SpaceApiClient
-    from .coordinator import SpaceApiDataUpdateCoordinator
+    from .coordinator import SpaceApiDataUpdateCoordinator, SpaceApiHostCoordinator
+    from .extractor import FieldExtractor
+    from .metrics import SpaceApiMetrics
+    from .store import SpaceApiStore
 
 
 type SpaceApiConfigEntry = ConfigEntry[SpaceApiData]
@@ -22,4 +27,73 @@ class SpaceApiData:
 
     client: SpaceApiClient
     coordinator: SpaceApiDataUpdateCoordinator
+    host_coordinator: SpaceApiHostCoordinator
     integration: Integration
+    store: SpaceApiStore
+    extractors: tuple[FieldExtractor, ...] = ()
+
+    @property
+    def metrics(self) -> SpaceApiMetrics:
+        """Return the request metrics of this entry's client."""
+        return self.client.metrics
+
+
+def _str_or_none(value: Any) -> str | None:
+    """Return the value if it is a non-blank string."""
+    if isinstance(value, str) and value.strip():
+        return value
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class SpaceState:
+    """Typed view of a SpaceAPI document, built once per fetch."""
+
+    space: str | None = None
+    open: bool = False
+    lastchange: int | None = None
+    message: str | None = None
+    trigger_person: str | None = None
+    people_now_present: int | None = None
+    # Raw sensors subtree for the sensor platform; entities compare the
+    # readings they render instead of the whole mapping.
+    sensors: Mapping[str, Any] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def from_document(cls, document: Any) -> SpaceState:
+        """Parse the fields the entities use from a SpaceAPI document."""
+        if not isinstance(document, dict):
+            return cls()
+        state = document.get("state")
+        if not isinstance(state, dict):
+            state = {}
+        sensors = document.get("sensors")
+        if not isinstance(sensors, dict):
+            sensors = {}
+
+        lastchange = state.get("lastchange")
+        if not isinstance(lastchange, int) or isinstance(lastchange, bool):
+            lastchange = None
+
+        people: int | None = None
+        readings = sensors.get("people_now_present")
+        if isinstance(readings, list):
+            values = [
+                reading["value"]
+                for reading in readings
+                if isinstance(reading, dict)
+                and isinstance(reading.get("value"), int)
+                and not isinstance(reading.get("value"), bool)
+            ]
+            if values:
+                people = sum(values)
+
+        return cls(
+            space=_str_or_none(document.get("space")),
+            open=bool(state.get("open", False)),
+            lastchange=lastchange,
+            message=_str_or_none(state.get("message")),
+            trigger_person=_str_or_none(state.get("trigger_person")),
+            people_now_present=people,
+            sensors=sensors,
+        )
@@ -0,0 +1,50 @@
+"""Diagnostics support for spaceapi_endpoint_client."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import CONF_API_KEY, CONF_WEBHOOK_ID, CONF_WEBHOOK_SECRET
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import SpaceApiConfigEntry
+
+TO_REDACT = {CONF_API_KEY, CONF_WEBHOOK_ID, CONF_WEBHOOK_SECRET}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: SpaceApiConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime_data = entry.runtime_data
+    host_coordinator = runtime_data.host_coordinator
+    # Entries sharing a host are polled by one of them; report its client.
+    client = host_coordinator.polling_client
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+            "stale_since": runtime_data.coordinator.stale_since,
+        },
+        "host": {
+            "key": host_coordinator.host_key,
+            "entries": len(host_coordinator.entries),
+            "endpoint": client.endpoint,
+            "update_interval": host_coordinator.poll_interval.total_seconds(),
+            "next_poll_in": (
+                host_coordinator.update_interval.total_seconds()
+                if host_coordinator.update_interval
+                else None
+            ),
+            "last_update_success": host_coordinator.last_update_success,
+            "push_connected": host_coordinator.push_connected,
+            "circuit_breaker": host_coordinator.breaker.as_dict(),
+            "retries": dict(client.retry_stats),
+        },
+        "metrics": client.metrics.as_dict(),
+    }
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -14,6 +17,11 @@ class SpaceApiEntity(CoordinatorEntity[SpaceApiDataUpdateCoordinator]):
 
     _attr_attribution = ATTRIBUTION
 
+    # SpaceState fields this entity renders. Coordinator updates that leave
+    # them and the availability unchanged skip the state machine write.
+    _watched_fields: tuple[str, ...] = ()
+    _last_fingerprint: tuple[Any, ...] | None = None
+
     def __init__(self, coordinator: SpaceApiDataUpdateCoordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
@@ -21,11 +29,7 @@ class SpaceApiEntity(CoordinatorEntity[SpaceApiDataUpdateCoordinator]):
 
         host_url = coordinator.config_entry.data.get(CONF_HOST, "Unknown")
 
-        device_name = f"SpaceAPI ({host_url})"
-        if isinstance(coordinator.data, dict):
-            space_name = coordinator.data.get("space")
-            if isinstance(space_name, str) and space_name.strip():
-                device_name = space_name
+        device_name = coordinator.space_state.space or f"SpaceAPI ({host_url})"
 
         self._attr_device_info = DeviceInfo(
             identifiers={
@@ -39,3 +43,25 @@ class SpaceApiEntity(CoordinatorEntity[SpaceApiDataUpdateCoordinator]):
             model="SpaceAPI v15",
             configuration_url=host_url,
         )
+
+    async def async_added_to_hass(self) -> None:
+        """Remember what was rendered when the entity was added."""
+        await super().async_added_to_hass()
+        self._last_fingerprint = self._fingerprint()
+
+    def _fingerprint(self) -> tuple[Any, ...]:
+        """Return the values that determine this entity's state."""
+        space_state = self.coordinator.space_state
+        return (
+            self.available,
+            *(getattr(space_state, name) for name in self._watched_fields),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when something this entity shows changed."""
+        fingerprint = self._fingerprint()
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        super()._handle_coordinator_update()
@@ -0,0 +1,117 @@
+"""User-defined field extractors for spaceapi_endpoint_client."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import slugify
+
+from .api import SpaceApiClientError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# One path segment: an object key followed by any number of list indexes,
+# e.g. ``state``, ``ext_ccc`` or ``temperature[0]``.
+_SEGMENT_PATTERN = re.compile(r"^([A-Za-z0-9_-]+)((?:\[\d+\])*)$")
+_INDEX_PATTERN = re.compile(r"\[(\d+)\]")
+_MISSING = object()
+
+# Longest string a sensor state may hold.
+MAX_STATE_LENGTH = 255
+
+
+@dataclass(frozen=True, slots=True)
+class FieldExtractor:
+    """A compiled selector that reads one field from a SpaceAPI document."""
+
+    path: str
+    key: str
+    # Dotted object-key prefix of the path, kept when the response is
+    # projected so the field is not stripped before it is extracted.
+    projection_path: str
+    get: Callable[[Any], Any]
+
+
+def _compile_steps(steps: tuple[str | int, ...]) -> Callable[[Any], Any]:
+    """Return an accessor that walks the steps, or yields None if one misses."""
+
+    def get(document: Any) -> Any:
+        value = document
+        for step in steps:
+            if isinstance(step, int):
+                if not isinstance(value, list) or step >= len(value):
+                    return None
+                value = value[step]
+            else:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(step, _MISSING)
+                if value is _MISSING:
+                    return None
+        return value
+
+    return get
+
+
+def compile_extractor(path: str) -> FieldExtractor:
+    """
+    Compile a JSONPath-like selector such as ``$.state.icon.open``.
+
+    The leading ``$.`` is optional. Segments are object keys separated by
+    dots, each optionally followed by ``[n]`` list indexes.
+    """
+    selector = path.strip()
+    body = selector.removeprefix("$.")
+    steps: list[str | int] = []
+    # Projection paths only address object keys, so they stop at the first
+    # list in the path.
+    keys: list[str] = []
+    for segment in body.split("."):
+        match = _SEGMENT_PATTERN.match(segment)
+        if match is None:
+            msg = f"Invalid field path: {path}"
+            raise SpaceApiClientError(msg)
+        name, indexes = match.groups()
+        if len(keys) == len(steps):
+            keys.append(name)
+        steps.append(name)
+        steps.extend(int(index) for index in _INDEX_PATTERN.findall(indexes))
+    return FieldExtractor(
+        path=selector,
+        key=slugify(body),
+        projection_path=".".join(keys),
+        get=_compile_steps(tuple(steps)),
+    )
+
+
+def parse_extractors(value: str | None) -> tuple[FieldExtractor, ...]:
+    """Compile a comma or newline separated list of selectors."""
+    if not value:
+        return ()
+    paths = [path.strip() for path in re.split(r"[,\n]", value) if path.strip()]
+    extractors: list[FieldExtractor] = []
+    invalid: list[str] = []
+    for path in paths:
+        try:
+            extractors.append(compile_extractor(path))
+        except SpaceApiClientError:
+            invalid.append(path)
+    if invalid:
+        msg = f"Invalid field path(s): {', '.join(invalid)}"
+        raise SpaceApiClientError(msg)
+    return tuple(extractors)
+
+
+def state_value(value: Any) -> str | int | float | None:
+    """Turn an extracted value into something a sensor state can hold."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, int | float):
+        return value
+    if isinstance(value, str):
+        return value[:MAX_STATE_LENGTH]
+    # Objects, lists and null have no single state.
+    return None
@@ -0,0 +1,217 @@
+"""In-memory request metrics for spaceapi_endpoint_client."""
+
+from __future__ import annotations
+
+import math
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+# Upper bounds (milliseconds) of the latency buckets. Fixed, so a histogram
+# costs the same memory after a year of polling as after the first poll.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Polls kept for the rolling success ratio and p95 latency.
+HEALTH_WINDOW = 20
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """Counts of observed durations per fixed bucket."""
+
+    counts: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    total: int = 0
+    sum_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration."""
+        milliseconds = seconds * 1000
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, milliseconds)] += 1
+        self.total += 1
+        self.sum_ms += milliseconds
+        self.max_ms = max(self.max_ms, milliseconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        buckets = {
+            f"<= {bound} ms": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.counts, strict=False)
+        }
+        buckets[f"> {LATENCY_BUCKETS_MS[-1]} ms"] = self.counts[-1]
+        return {
+            "count": self.total,
+            "mean_ms": round(self.sum_ms / self.total, 1) if self.total else None,
+            "max_ms": round(self.max_ms, 1),
+            "buckets": buckets,
+        }
+
+
+@dataclass(slots=True)
+class SpaceApiMetrics:
+    """Timings and transport counters of one entry's client."""
+
+    dns: LatencyHistogram = field(default_factory=LatencyHistogram)
+    connect: LatencyHistogram = field(default_factory=LatencyHistogram)
+    ttfb: LatencyHistogram = field(default_factory=LatencyHistogram)
+    body: LatencyHistogram = field(default_factory=LatencyHistogram)
+    decode: LatencyHistogram = field(default_factory=LatencyHistogram)
+    requests: int = 0
+    reused_connections: int = 0
+    bytes_received: int = 0
+    fallback_hits: int = 0
+    not_modified: int = 0
+    timeouts: int = 0
+    auth_failures: int = 0
+    # Whole polls (retries and fallback included), for the health sensors.
+    poll_results: deque[bool] = field(
+        default_factory=lambda: deque(maxlen=HEALTH_WINDOW)
+    )
+    poll_latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=HEALTH_WINDOW)
+    )
+    last_poll_latency: float | None = None
+    last_payload_size: int | None = None
+
+    def record_poll(self, *, success: bool, seconds: float) -> None:
+        """Record the outcome of one poll; only successes carry a latency."""
+        self.poll_results.append(success)
+        if success:
+            self.poll_latencies.append(seconds)
+            self.last_poll_latency = seconds
+
+    @property
+    def success_ratio(self) -> float | None:
+        """Return the share of the recent polls that succeeded."""
+        if not self.poll_results:
+            return None
+        return sum(self.poll_results) / len(self.poll_results)
+
+    @property
+    def p95_poll_latency(self) -> float | None:
+        """Return the 95th percentile latency of the recent successful polls."""
+        if not self.poll_latencies:
+            return None
+        latencies = sorted(self.poll_latencies)
+        # Nearest-rank percentile.
+        return latencies[math.ceil(0.95 * len(latencies)) - 1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics for diagnostics."""
+        return {
+            "latency": {
+                "dns": self.dns.as_dict(),
+                "connect": self.connect.as_dict(),
+                "ttfb": self.ttfb.as_dict(),
+                "body": self.body.as_dict(),
+                "decode": self.decode.as_dict(),
+            },
+            "requests": self.requests,
+            "reused_connections": self.reused_connections,
+            "bytes_received": self.bytes_received,
+            "fallback_hits": self.fallback_hits,
+            "not_modified": self.not_modified,
+            "timeouts": self.timeouts,
+            "auth_failures": self.auth_failures,
+            "polls": {
+                "window": len(self.poll_results),
+                "success_ratio": self.success_ratio,
+                "last_latency_ms": _milliseconds(self.last_poll_latency),
+                "p95_latency_ms": _milliseconds(self.p95_poll_latency),
+                "last_payload_size": self.last_payload_size,
+            },
+        }
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Convert a duration for display, keeping None."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """
+    Return a TraceConfig that times requests into their SpaceApiMetrics.
+
+    A request opts in by passing its metrics as ``trace_request_ctx``;
+    requests without one are not recorded.
+    """
+    trace_config = aiohttp.TraceConfig()
+
+    def metrics_of(ctx: SimpleNamespace) -> SpaceApiMetrics | None:
+        metrics = ctx.trace_request_ctx
+        return metrics if isinstance(metrics, SpaceApiMetrics) else None
+
+    async def on_request_start(
+        _session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        _params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        ctx.start = time.perf_counter()
+        ctx.dns = 0.0
+
+    async def on_dns_resolvehost_start(
+        _session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        _params: aiohttp.TraceDnsResolveHostStartParams,
+    ) -> None:
+        ctx.dns_start = time.perf_counter()
+
+    async def on_dns_resolvehost_end(
+        _session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        _params: aiohttp.TraceDnsResolveHostEndParams,
+    ) -> None:
+        ctx.dns = time.perf_counter() - ctx.dns_start
+        if (metrics := metrics_of(ctx)) is not None:
+            metrics.dns.observe(ctx.dns)
+
+    async def on_connection_create_start(
+        _session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        _params: aiohttp.TraceConnectionCreateStartParams,
+    ) -> None:
+        ctx.connect_start = time.perf_counter()
+
+    async def on_connection_create_end(
+        _session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        _params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        if (metrics := metrics_of(ctx)) is not None:
+            # TCP and TLS handshakes; the DNS lookup is its own histogram.
+            metrics.connect.observe(time.perf_counter() - ctx.connect_start - ctx.dns)
+
+    async def on_connection_reuseconn(
+        _session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        _params: aiohttp.TraceConnectionReuseconnParams,
+    ) -> None:
+        if (metrics := metrics_of(ctx)) is not None:
+            metrics.reused_connections += 1
+
+    async def on_request_end(
+        _session: aiohttp.ClientSession,
+        ctx: SimpleNamespace,
+        _params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        # Fired once the response headers are in.
+        if (metrics := metrics_of(ctx)) is not None:
+            metrics.ttfb.observe(time.perf_counter() - ctx.start)
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
@@ -0,0 +1,470 @@
+"""Sensor platform for spaceapi_endpoint_client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    CONCENTRATION_PARTS_PER_MILLION,
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfPower,
+    UnitOfPressure,
+    UnitOfSpeed,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import BaseCoordinatorEntity
+from homeassistant.util import slugify
+
+from .api import ENDPOINT_FALLBACK, ENDPOINT_PRIMARY
+from .entity import SpaceApiEntity
+from .extractor import state_value
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
+
+    from .api import SpaceApiClient
+    from .coordinator import SpaceApiDataUpdateCoordinator
+    from .data import SpaceApiConfigEntry
+    from .extractor import FieldExtractor
+
+
+@dataclass(frozen=True, slots=True)
+class SensorKind:
+    """How readings of one SpaceAPI sensor type map onto Home Assistant."""
+
+    device_class: SensorDeviceClass | None = None
+    state_class: SensorStateClass | None = SensorStateClass.MEASUREMENT
+    # SpaceAPI unit strings mapped to HA units. The device class is only set
+    # when the published unit is one HA accepts for it.
+    units: Mapping[str, str] | None = None
+    icon: str | None = None
+
+
+SENSOR_KINDS: dict[str, SensorKind] = {
+    "temperature": SensorKind(
+        SensorDeviceClass.TEMPERATURE,
+        units={
+            "°C": UnitOfTemperature.CELSIUS,
+            "°F": UnitOfTemperature.FAHRENHEIT,
+            "K": UnitOfTemperature.KELVIN,
+        },
+    ),
+    "humidity": SensorKind(SensorDeviceClass.HUMIDITY, units={"%": PERCENTAGE}),
+    "barometer": SensorKind(
+        SensorDeviceClass.PRESSURE,
+        units={"hPa": UnitOfPressure.HPA, "hPA": UnitOfPressure.HPA},
+    ),
+    "carbondioxide": SensorKind(
+        SensorDeviceClass.CO2, units={"ppm": CONCENTRATION_PARTS_PER_MILLION}
+    ),
+    "power_consumption": SensorKind(
+        SensorDeviceClass.POWER,
+        units={"W": UnitOfPower.WATT},
+    ),
+    "power_generation": SensorKind(
+        SensorDeviceClass.POWER,
+        units={"W": UnitOfPower.WATT},
+    ),
+    "wind": SensorKind(
+        SensorDeviceClass.WIND_SPEED,
+        units={
+            "m/s": UnitOfSpeed.METERS_PER_SECOND,
+            "km/h": UnitOfSpeed.KILOMETERS_PER_HOUR,
+        },
+        icon="mdi:weather-windy",
+    ),
+    # A balance goes up and down and has no meaningful "measurement" mean;
+    # HA only allows TOTAL for monetary sensors.
+    "account_balance": SensorKind(
+        SensorDeviceClass.MONETARY, state_class=SensorStateClass.TOTAL
+    ),
+    "people_now_present": SensorKind(icon="mdi:account-multiple"),
+    "total_member_count": SensorKind(icon="mdi:account-group"),
+    "network_connections": SensorKind(icon="mdi:lan-connect"),
+    "beverage_supply": SensorKind(icon="mdi:bottle-soda"),
+    "network_traffic": SensorKind(icon="mdi:swap-vertical"),
+    "radiation": SensorKind(icon="mdi:radioactive"),
+}
+DEFAULT_SENSOR_KIND = SensorKind()
+
+# Kind of the readings produced by the user-defined field extractors. Their
+# state class is picked from the first value (see SpaceApiSensor).
+FIELD_KIND = "field"
+
+
+def _milliseconds(seconds: float | None) -> float | None:
+    """Return a latency in milliseconds, keeping None."""
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SpaceApiHealthSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor fed by the polling client's metrics."""
+
+    value_fn: Callable[[SpaceApiClient], StateType]
+
+
+# Diagnostic sensors about the endpoint itself. Disabled by default, so they
+# add no recorder load unless enabled.
+HEALTH_DESCRIPTIONS = (
+    SpaceApiHealthSensorEntityDescription(
+        key="last_poll_latency",
+        name="Poll latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda client: _milliseconds(client.metrics.last_poll_latency),
+    ),
+    SpaceApiHealthSensorEntityDescription(
+        key="p95_poll_latency",
+        name="Poll latency p95",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda client: _milliseconds(client.metrics.p95_poll_latency),
+    ),
+    SpaceApiHealthSensorEntityDescription(
+        key="poll_success_ratio",
+        name="Poll success ratio",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:check-network-outline",
+        value_fn=lambda client: (
+            None
+            if (ratio := client.metrics.success_ratio) is None
+            else round(ratio * 100, 1)
+        ),
+    ),
+    SpaceApiHealthSensorEntityDescription(
+        key="endpoint",
+        name="Endpoint",
+        device_class=SensorDeviceClass.ENUM,
+        options=[ENDPOINT_PRIMARY, ENDPOINT_FALLBACK],
+        icon="mdi:api",
+        value_fn=lambda client: client.endpoint,
+    ),
+    SpaceApiHealthSensorEntityDescription(
+        key="payload_size",
+        name="Payload size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda client: client.metrics.last_payload_size,
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SensorReading:
+    """One value from a SpaceAPI document, usually from the ``sensors`` tree."""
+
+    kind: str
+    name: str
+    value: float | int | str
+    unit: str | None = None
+
+
+def _is_number(value: Any) -> bool:
+    """Return whether the value is a JSON number (not a boolean)."""
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _label(reading: Mapping[str, Any], index: int) -> str:
+    """Return a stable label for a reading within its sensor type."""
+    parts = [
+        str(reading[field])
+        for field in ("location", "name")
+        if isinstance(reading.get(field), str) and reading[field].strip()
+    ]
+    return " ".join(parts) or str(index)
+
+
+def _title(*parts: str) -> str:
+    """Build an entity name like ``Temperature Lab`` from key parts."""
+    name = " ".join(parts).replace("_", " ").strip()
+    return name[:1].upper() + name[1:]
+
+
+def _iter_readings(
+    kind: str, prefix: str, readings: Any
+) -> Iterator[tuple[str, SensorReading]]:
+    """Yield ``(key, reading)`` for a list of SpaceAPI sensor readings."""
+    if not isinstance(readings, list):
+        return
+    for index, reading in enumerate(readings):
+        if not isinstance(reading, dict):
+            continue
+        label = _label(reading, index)
+        if _is_number(reading.get("value")):
+            unit = reading.get("unit")
+            yield (
+                slugify(f"{prefix} {label}"),
+                SensorReading(
+                    kind=kind,
+                    name=_title(prefix, label),
+                    value=reading["value"],
+                    unit=unit if isinstance(unit, str) else None,
+                ),
+            )
+        # wind and network_traffic nest their values under "properties".
+        properties = reading.get("properties")
+        if isinstance(properties, dict):
+            for prop, measured in properties.items():
+                if isinstance(measured, dict) and _is_number(measured.get("value")):
+                    unit = measured.get("unit")
+                    yield (
+                        slugify(f"{prefix} {label} {prop}"),
+                        SensorReading(
+                            kind=kind,
+                            name=_title(prefix, label, prop),
+                            value=measured["value"],
+                            unit=unit if isinstance(unit, str) else None,
+                        ),
+                    )
+
+
+def parse_readings(sensors: Mapping[str, Any]) -> dict[str, SensorReading]:
+    """Flatten a SpaceAPI ``sensors`` object into readings keyed by a slug."""
+    readings: dict[str, SensorReading] = {}
+    for kind, value in sensors.items():
+        if kind == "door_locked":
+            # Boolean readings; not a numeric sensor.
+            continue
+        if isinstance(value, dict):
+            # radiation groups its readings by particle type.
+            for group, group_readings in value.items():
+                readings.update(_iter_readings(kind, f"{kind} {group}", group_readings))
+        else:
+            readings.update(_iter_readings(kind, kind, value))
+    return readings
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: SpaceApiConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensor platform."""
+    index = SpaceApiSensorIndex(
+        entry.runtime_data.coordinator,
+        entry.runtime_data.extractors,
+        async_add_entities,
+    )
+    entry.async_on_unload(index.async_start())
+    async_add_entities(
+        SpaceApiHealthSensor(entry.runtime_data.coordinator, entity_description)
+        for entity_description in HEALTH_DESCRIPTIONS
+    )
+
+
+class SpaceApiSensorIndex:
+    """
+    Key → entity index that fans coordinator updates out to sensor entities.
+
+    One coordinator listener diffs the readings against the previous poll and
+    writes only the entities whose reading changed, instead of every sensor
+    entity re-rendering on every poll. Sensors that appear in a later payload
+    are added on the fly; the entry's field extractors always get an entity.
+    """
+
+    def __init__(
+        self,
+        coordinator: SpaceApiDataUpdateCoordinator,
+        extractors: tuple[FieldExtractor, ...],
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Initialize the index."""
+        self._coordinator = coordinator
+        self._extractors = extractors
+        self._async_add_entities = async_add_entities
+        self._entities: dict[str, SpaceApiSensor] = {}
+        self._available = coordinator.last_update_success
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Create the initial entities and start listening for updates."""
+        readings = self._readings()
+        fields = [
+            SpaceApiSensor(
+                self._coordinator,
+                f"{FIELD_KIND}_{extractor.key}",
+                extractor.path,
+                FIELD_KIND,
+                readings.get(f"{FIELD_KIND}_{extractor.key}"),
+            )
+            for extractor in self._extractors
+        ]
+        if fields:
+            self._entities.update((entity.key, entity) for entity in fields)
+            self._async_add_entities(fields)
+        self._async_handle_update()
+        return self._coordinator.async_add_listener(self._async_handle_update)
+
+    def _readings(self) -> dict[str, SensorReading]:
+        """Return this poll's readings, including the extracted fields."""
+        readings = parse_readings(self._coordinator.space_state.sensors)
+        for extractor in self._extractors:
+            value = state_value(extractor.get(self._coordinator.data))
+            if value is not None:
+                readings[f"{FIELD_KIND}_{extractor.key}"] = SensorReading(
+                    kind=FIELD_KIND, name=extractor.path, value=value
+                )
+        return readings
+
+    @callback
+    def _async_handle_update(self) -> None:
+        """Apply a coordinator update to the entities that changed."""
+        readings = self._readings()
+        available = self._coordinator.last_update_success
+        availability_changed = available != self._available
+        self._available = available
+
+        new_entities: list[SpaceApiSensor] = []
+        for key, reading in readings.items():
+            entity = self._entities.get(key)
+            if entity is None:
+                entity = SpaceApiSensor(
+                    self._coordinator, key, reading.name, reading.kind, reading
+                )
+                self._entities[key] = entity
+                new_entities.append(entity)
+            elif entity.async_set_reading(reading) or availability_changed:
+                entity.async_write_if_added()
+
+        # Sensors that vanished from the payload go unavailable until they
+        # come back, rather than keeping a stale value.
+        for key, entity in self._entities.items():
+            if key not in readings and (
+                entity.async_set_reading(None) or availability_changed
+            ):
+                entity.async_write_if_added()
+
+        if new_entities:
+            self._async_add_entities(new_entities)
+
+
+class SpaceApiSensor(SpaceApiEntity, SensorEntity):
+    """Sensor for one value of the space document."""
+
+    def __init__(
+        self,
+        coordinator: SpaceApiDataUpdateCoordinator,
+        key: str,
+        name: str,
+        kind: str,
+        reading: SensorReading | None,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+        self.key = key
+        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_sensor_{key}"
+        self._attr_name = name
+        self._reading = reading
+
+        unit = reading.unit if reading is not None else None
+        description = SENSOR_KINDS.get(kind, DEFAULT_SENSOR_KIND)
+        self._attr_state_class = description.state_class
+        self._attr_icon = description.icon
+        if kind == FIELD_KIND:
+            # Arbitrary fields only get statistics when they hold numbers.
+            self._attr_icon = "mdi:code-json"
+            if reading is None or isinstance(reading.value, str):
+                self._attr_state_class = None
+        elif description.device_class is SensorDeviceClass.MONETARY:
+            # The unit is the ISO 4217 currency code.
+            self._attr_device_class = description.device_class
+            self._attr_native_unit_of_measurement = unit
+        elif description.units is not None and unit in description.units:
+            self._attr_device_class = description.device_class
+            self._attr_native_unit_of_measurement = description.units[unit]
+        else:
+            self._attr_native_unit_of_measurement = unit
+
+    async def async_added_to_hass(self) -> None:
+        """Register with Home Assistant without a per-entity coordinator listener."""
+        # SpaceApiSensorIndex owns the single listener and writes this entity
+        # only when its reading changed.
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+
+    @property
+    def available(self) -> bool:
+        """Return whether the last poll succeeded and still has this reading."""
+        return super().available and self._reading is not None
+
+    @property
+    def native_value(self) -> float | int | str | None:
+        """Return the reading's value."""
+        if self._reading is None:
+            return None
+        if self._attr_state_class is not None and isinstance(self._reading.value, str):
+            # A numeric field turned into text; statistics cannot take it.
+            return None
+        return self._reading.value
+
+    @callback
+    def async_set_reading(self, reading: SensorReading | None) -> bool:
+        """Store a new reading; return whether it differs from the current one."""
+        if reading == self._reading:
+            return False
+        self._reading = reading
+        return True
+
+    @callback
+    def async_write_if_added(self) -> None:
+        """Write the state if the entity has been added to Home Assistant."""
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+
+class SpaceApiHealthSensor(SpaceApiEntity, SensorEntity):
+    """Diagnostic sensor about the health of the SpaceAPI endpoint."""
+
+    entity_description: SpaceApiHealthSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: SpaceApiDataUpdateCoordinator,
+        entity_description: SpaceApiHealthSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+        self.entity_description = entity_description
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{entity_description.key}"
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Update after every poll of the host, not only on changed data."""
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        host_coordinator = self.coordinator.config_entry.runtime_data.host_coordinator
+        self.async_on_remove(
+            host_coordinator.async_add_poll_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def available(self) -> bool:
+        """Stay available while polls fail; failures are what is measured."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value from the polling client's metrics."""
+        host_coordinator = self.coordinator.config_entry.runtime_data.host_coordinator
+        return self.entity_description.value_fn(host_coordinator.polling_client)
@@ -0,0 +1,88 @@
+"""Integration-owned HTTP connection pool for spaceapi_endpoint_client."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util import ssl as ssl_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DOMAIN,
+    POOL_DNS_CACHE_TTL,
+    POOL_KEEPALIVE_TIMEOUT,
+    POOL_LIMIT,
+    POOL_LIMIT_PER_HOST,
+)
+from .metrics import create_trace_config
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event, HomeAssistant
+
+    from .data import SpaceApiConfigEntry
+
+DATA_SESSION: HassKey[SpaceApiSession] = HassKey(f"{DOMAIN}_session")
+
+
+class SpaceApiSession:
+    """One aiohttp session shared by every entry of the integration."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create the session and its tuned connector."""
+        self.entry_ids: set[str] = set()
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=POOL_DNS_CACHE_TTL,
+                keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+                ssl=ssl_util.get_default_context(),
+            ),
+            headers={aiohttp.hdrs.USER_AGENT: SERVER_SOFTWARE},
+            # Times requests that pass their SpaceApiMetrics as
+            # trace_request_ctx.
+            trace_configs=[create_trace_config()],
+        )
+        # Entries are not unloaded when Home Assistant stops.
+        self._unsub_close = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop
+        )
+
+    async def _async_close_on_stop(self, _event: Event) -> None:
+        """Close the session when Home Assistant shuts down."""
+        self._unsub_close = None
+        await self.session.close()
+
+    async def async_close(self) -> None:
+        """Close the session and its pooled connections."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self.session.close()
+
+
+@callback
+def async_acquire_session(
+    hass: HomeAssistant, entry: SpaceApiConfigEntry
+) -> aiohttp.ClientSession:
+    """Return the integration's session, creating it for the first entry."""
+    if (pool := hass.data.get(DATA_SESSION)) is None:
+        pool = hass.data[DATA_SESSION] = SpaceApiSession(hass)
+    pool.entry_ids.add(entry.entry_id)
+    return pool.session
+
+
+async def async_release_session(
+    hass: HomeAssistant, entry: SpaceApiConfigEntry
+) -> None:
+    """Drop an entry's claim on the session; close it with the last one."""
+    if (pool := hass.data.get(DATA_SESSION)) is None:
+        return
+    pool.entry_ids.discard(entry.entry_id)
+    if not pool.entry_ids:
+        del hass.data[DATA_SESSION]
+        await pool.async_close()
@@ -0,0 +1,73 @@
+"""Persistent per-entry state for spaceapi_endpoint_client."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+class SpaceApiStore:
+    """Per-entry state that should survive Home Assistant restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store for a config entry."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted state from disk."""
+        self._data = await self._store.async_load() or {}
+
+    async def async_remove(self) -> None:
+        """Delete the persisted state (entry removed)."""
+        await self._store.async_remove()
+
+    def endpoint(self, host_url: str) -> str | None:
+        """Return the learned endpoint, if it was learned for this host."""
+        if self._data.get("host") != host_url:
+            return None
+        return self._data.get("endpoint")
+
+    def payload(self, host_url: str) -> Any:
+        """Return the last good document, if it was fetched from this host."""
+        if self._data.get("host") != host_url:
+            return None
+        return self._data.get("payload")
+
+    @callback
+    def async_set_endpoint(self, host_url: str, endpoint: str) -> None:
+        """Remember which endpoint serves the space state for this host."""
+        if self.endpoint(host_url) == endpoint:
+            return
+        self._async_use_host(host_url)
+        self._data["endpoint"] = endpoint
+        self._async_schedule_save()
+
+    @callback
+    def async_set_payload(self, host_url: str, payload: Any) -> None:
+        """Remember the last good document to start from after a restart."""
+        if self.payload(host_url) is payload:
+            return
+        self._async_use_host(host_url)
+        self._data["payload"] = payload
+        self._async_schedule_save()
+
+    @callback
+    def _async_use_host(self, host_url: str) -> None:
+        """Forget what was learned about another host (entry reconfigured)."""
+        if self._data.get("host") != host_url:
+            self._data = {"host": host_url}
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Coalesce writes so a burst of changes hits the disk once."""
+        self._store.async_delay_save(lambda: self._data, STORAGE_SAVE_DELAY)
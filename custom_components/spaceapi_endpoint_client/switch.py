@@ -46,6 +46,8 @@ async def async_setup_entry(
 class SpaceApiSwitch(SpaceApiEntity, SwitchEntity):
     """Switch that toggles the space's open/closed state via the SpaceAPI."""
 
+    _watched_fields = ("open",)
+
     def __init__(
         self,
         coordinator: SpaceApiDataUpdateCoordinator,
@@ -59,6 +61,7 @@ class SpaceApiSwitch(SpaceApiEntity, SwitchEntity):
         )
         self._attr_assumed_state = False
         self._optimistic_state: bool | None = None
+        self._pending_state: bool | None = None
         self._lock = asyncio.Lock()
 
     @property
@@ -66,7 +69,7 @@ class SpaceApiSwitch(SpaceApiEntity, SwitchEntity):
         """Return true if the switch is on."""
         if self._optimistic_state is not None:
             return self._optimistic_state
-        return self.coordinator.data.get("state", {}).get("open", False)
+        return self.coordinator.space_state.open
 
     async def async_turn_on(self, **_: Any) -> None:
         """Turn on the switch."""
@@ -77,34 +80,62 @@ class SpaceApiSwitch(SpaceApiEntity, SwitchEntity):
         await self._async_set_state(open_state=False)
 
     async def _async_set_state(self, *, open_state: bool) -> None:
-        """Send a state change to the API with optimistic UI + debounce."""
-        verb = "open" if open_state else "close"
+        """Send a state change to the API with optimistic UI + coalescing."""
+        # Latest wins: while a POST is in flight only the newest desired state
+        # is kept, and the in-flight call sends it once it is done.
+        self._pending_state = open_state
 
         if self._lock.locked():
             LOGGER.debug(
-                "Ignoring turn_%s request - switch operation already in progress",
+                "Queueing turn_%s request - switch operation already in progress",
                 "on" if open_state else "off",
             )
+            self._optimistic_state = open_state
+            self.async_write_ha_state()
             return
 
-        client = self.coordinator.config_entry.runtime_data.client
-
         async with self._lock:
-            self._optimistic_state = open_state
+            confirmed_state: bool | None = None
+            while (desired := self._pending_state) is not None:
+                self._pending_state = None
+                if desired == confirmed_state:
+                    LOGGER.debug("Skipping queued request - state already confirmed")
+                    continue
+                await self._async_send_state(open_state=desired)
+                confirmed_state = desired
+
+            self._optimistic_state = None
+            # The coordinator skips listeners when the data is unchanged,
+            # so drop the optimistic value from the UI ourselves.
             self.async_write_ha_state()
 
-            try:
-                LOGGER.debug(
-                    "Sending POST request to %s space (state=%s)", verb, open_state
-                )
-                await client.async_set_space_state(open_state=open_state)
-                LOGGER.debug("POST request to %s space completed successfully", verb)
+    async def _async_send_state(self, *, open_state: bool) -> None:
+        """POST one state change and apply the result to the coordinator."""
+        verb = "open" if open_state else "close"
+        client = self.coordinator.config_entry.runtime_data.client
+
+        self._optimistic_state = open_state
+        self.async_write_ha_state()
+
+        try:
+            LOGGER.debug(
+                "Sending POST request to %s space (state=%s)", verb, open_state
+            )
+            result = await client.async_set_space_state(open_state=open_state)
+            LOGGER.debug("POST request to %s space completed successfully", verb)
+            self.coordinator.async_note_local_action()
+            if not self.coordinator.async_apply_server_state(result):
+                # The server did not echo the new state, so give it time to
+                # commit the write and read it back.
                 await asyncio.sleep(API_SETTLE_DELAY)
-                self._optimistic_state = None
-                await self.coordinator.async_request_refresh()
-            except SpaceApiClientError as err:
-                LOGGER.error("Failed to send POST request to %s space: %s", verb, err)
-                self._optimistic_state = None
                 await self.coordinator.async_request_refresh()
-                msg = f"Failed to turn {'on' if open_state else 'off'} space: {err}"
-                raise HomeAssistantError(msg) from err
+        except SpaceApiClientError as err:
+            LOGGER.error("Failed to send POST request to %s space: %s", verb, err)
+            # Anything queued behind a failed request is dropped; the user
+            # sees the real state again and can retry.
+            self._pending_state = None
+            self._optimistic_state = None
+            await self.coordinator.async_request_refresh()
+            self.async_write_ha_state()
+            msg = f"Failed to turn {'on' if open_state else 'off'} space: {err}"
+            raise HomeAssistantError(msg) from err
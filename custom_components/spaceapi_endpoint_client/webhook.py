@@ -0,0 +1,69 @@
+"""Inbound webhook for spaceapi_endpoint_client."""
+
+from __future__ import annotations
+
+import hmac
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from aiohttp import hdrs, web
+from homeassistant.components import webhook
+
+from .api import is_space_document
+from .const import (
+    CONF_WEBHOOK,
+    CONF_WEBHOOK_ID,
+    CONF_WEBHOOK_SECRET,
+    DOMAIN,
+    LOGGER,
+    WEBHOOK_SECRET_HEADER,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import SpaceApiConfigEntry
+
+
+def async_register_webhook(hass: HomeAssistant, entry: SpaceApiConfigEntry) -> None:
+    """Register the entry's webhook, if enabled, and unregister it on unload."""
+    if not entry.options.get(CONF_WEBHOOK):
+        return
+    webhook_id = entry.options.get(CONF_WEBHOOK_ID)
+    secret = entry.options.get(CONF_WEBHOOK_SECRET)
+    if not webhook_id or not secret:
+        LOGGER.warning("Webhook enabled for %s but not configured", entry.title)
+        return
+
+    async def _async_handle_webhook(
+        hass: HomeAssistant,  # noqa: ARG001 — required by the webhook API
+        webhook_id: str,  # noqa: ARG001 — required by the webhook API
+        request: web.Request,
+    ) -> web.Response:
+        """Push a POSTed space document into the coordinator."""
+        if not hmac.compare_digest(
+            request.headers.get(WEBHOOK_SECRET_HEADER, ""), secret
+        ):
+            LOGGER.warning("Rejected webhook call for %s: bad secret", entry.title)
+            return web.Response(status=HTTPStatus.UNAUTHORIZED)
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+        if not is_space_document(payload):
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+        LOGGER.debug("Received space state for %s via webhook", entry.title)
+        entry.runtime_data.host_coordinator.async_apply_server_state(payload)
+        return web.Response(status=HTTPStatus.NO_CONTENT)
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        entry.title,
+        webhook_id,
+        _async_handle_webhook,
+        allowed_methods=[hdrs.METH_POST],
+    )
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark the JSON decoders used by the SpaceAPI client.
+
+Decodes representative SpaceAPI v15 documents with the stdlib ``json`` module
+and, when it is importable, ``orjson`` (the decoder the client picks by
+default). Three payloads are measured: a minimal document as served by the
+spaceapi-endpoint companion server, a typical public ``spaceapi.json`` with a
+handful of sensors, and a large one with many sensors, projects and events.
+
+Usage: python3 scripts/bench_decoder.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _base_document() -> dict:
+    return {
+        "api_compatibility": ["15"],
+        "space": "Example Hackerspace",
+        "logo": "https://example.org/logo.png",
+        "url": "https://example.org",
+        "location": {
+            "address": "Examplestreet 1, 12345 Example City",
+            "lat": 52.5,
+            "lon": 13.4,
+            "timezone": "Europe/Berlin",
+        },
+        "contact": {"email": "info@example.org", "matrix": "#space:example.org"},
+        "state": {
+            "open": True,
+            "lastchange": 1_700_000_000,
+            "trigger_person": "Home Assistant SpaceAPI",
+            "message": "Space was switched on",
+        },
+    }
+
+
+def _sensor(kind: str, index: int) -> dict:
+    return {
+        "value": 20.5 + index,
+        "unit": "°C" if kind == "temperature" else "%",
+        "location": f"Room {index}",
+        "name": f"{kind} {index}",
+        "description": f"{kind} sensor number {index} in the main area",
+        "lastchange": 1_700_000_000 + index,
+    }
+
+
+def _document(sensors_per_kind: int, projects: int, events: int) -> bytes:
+    document = _base_document()
+    kinds = ("temperature", "humidity", "barometer", "power_consumption")
+    document["sensors"] = {
+        kind: [_sensor(kind, i) for i in range(sensors_per_kind)] for kind in kinds
+    }
+    document["sensors"]["people_now_present"] = [{"value": 3}]
+    document["projects"] = [f"https://example.org/project/{i}" for i in range(projects)]
+    document["events"] = [
+        {"name": f"member {i}", "type": "check-in", "timestamp": 1_700_000_000 + i}
+        for i in range(events)
+    ]
+    return json.dumps(document).encode()
+
+
+PAYLOADS = {
+    "minimal": json.dumps(_base_document()).encode(),
+    "typical": _document(sensors_per_kind=3, projects=5, events=10),
+    "large": _document(sensors_per_kind=200, projects=300, events=2000),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    decoders = {"json": json.loads}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    else:
+        print("orjson is not installed; only the stdlib decoder is measured")
+
+    for name, payload in PAYLOADS.items():
+        number = max(1, args.number // max(1, len(payload) // 10_000))
+        timings = {
+            decoder_name: timeit.timeit(
+                lambda d=decoder, p=payload: d(p), number=number
+            )
+            / number
+            for decoder_name, decoder in decoders.items()
+        }
+        line = ", ".join(f"{k}: {v * 1e6:9.1f} µs" for k, v in timings.items())
+        speedup = ""
+        if "orjson" in timings:
+            speedup = f"  ({timings['json'] / timings['orjson']:.1f}x)"
+        print(f"{name:8} {len(payload):>9} bytes  {line}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,36 @@
 
 from __future__ import annotations
 
+import json
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from multidict import CIMultiDict
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
 
 from custom_components.spaceapi_endpoint_client.api import (
+    ENDPOINT_FALLBACK,
+    ENDPOINT_PRIMARY,
+    FALLBACK_CONNECT_TIMEOUT,
     MAX_API_KEY_LENGTH,
+    RETRY_ATTEMPTS,
+    RETRY_DEADLINE,
+    CircuitState,
     SpaceApiClient,
     SpaceApiClientAuthenticationError,
+    SpaceApiClientCircuitOpenError,
     SpaceApiClientCommunicationError,
     SpaceApiClientError,
+    SpaceApiClientRateLimitedError,
+    SpaceApiClientSettings,
+    normalize_host_key,
+    parse_max_age,
+    parse_projection,
+    parse_retry_after,
+    project_document,
     validate_and_sanitize_api_key,
     validate_and_sanitize_host_url,
 )
@@ -43,6 +63,21 @@ class TestValidateHostUrl:
             validate_and_sanitize_host_url(None)  # type: ignore[arg-type]
 
 
+class TestNormalizeHostKey:
+    """normalize_host_key."""
+
+    def test_equivalent_spellings_share_a_key(self) -> None:
+        assert normalize_host_key("https://Example.COM:443/") == normalize_host_key(
+            " https://example.com"
+        )
+
+    def test_keeps_path_and_non_default_port(self) -> None:
+        assert (
+            normalize_host_key("http://Example.com:8080/space.json/")
+            == "http://example.com:8080/space.json"
+        )
+
+
 class TestValidateApiKey:
     """validate_and_sanitize_api_key."""
 
@@ -70,6 +105,49 @@ class TestValidateApiKey:
         assert validate_and_sanitize_api_key(key) == key
 
 
+def _fake_response(
+    status: int, payload: object, headers: dict | None = None
+) -> MagicMock:
+    """Build a fake aiohttp response whose body streams the JSON payload."""
+    body = json.dumps(payload).encode()
+
+    async def iter_chunked(_size: int):
+        yield body
+
+    response = MagicMock()
+    response.status = status
+    response.headers = CIMultiDict(headers or {})
+    response.content_length = len(body)
+    response.raise_for_status = MagicMock()
+    response.content.iter_chunked = iter_chunked
+    return response
+
+
+class _RequestContext:
+    """Stand-in for aiohttp's request context manager."""
+
+    def __init__(self, respond: Awaitable[MagicMock]) -> None:
+        self._respond = respond
+        self.response: MagicMock | None = None
+
+    async def __aenter__(self) -> MagicMock:
+        self.response = await self._respond
+        return self.response
+
+    async def __aexit__(self, *_: object) -> None:
+        self.response.release()
+
+
+def _request_mock(**kwargs: Any) -> MagicMock:
+    """Mock session.request; the response is used as a context manager."""
+    respond = AsyncMock(**kwargs)
+    return MagicMock(
+        side_effect=lambda *args, **call_kwargs: _RequestContext(
+            respond(*args, **call_kwargs)
+        )
+    )
+
+
 def _mock_session_returning(
     json_payloads: dict[str, dict] | None = None,
     raise_for_url: dict[str, Exception] | None = None,
@@ -81,14 +159,10 @@ def _mock_session_returning(
     async def request(method: str, url: str, **_: object) -> MagicMock:
         if url in raise_for_url:
             raise raise_for_url[url]
-        response = MagicMock()
-        response.status = 200
-        response.raise_for_status = MagicMock()
-        response.json = AsyncMock(return_value=json_payloads.get(url, {}))
-        return response
+        return _fake_response(200, json_payloads.get(url, {}))
 
     session = MagicMock()
-    session.request = AsyncMock(side_effect=request)
+    session.request = _request_mock(side_effect=request)
     return session
 
 
@@ -132,19 +206,687 @@ class TestAsyncGetSpaceState:
 
     async def test_no_fallback_on_auth_error(self) -> None:
         async def request(method: str, url: str, **_: object) -> MagicMock:
-            response = MagicMock()
-            response.status = 401
-            response.raise_for_status = MagicMock()
-            response.json = AsyncMock(return_value={})
-            return response
+            return _fake_response(401, {})
 
         session = MagicMock()
-        session.request = AsyncMock(side_effect=request)
+        session.request = _request_mock(side_effect=request)
         client = SpaceApiClient(host_url="https://example.com", session=session)
         with pytest.raises(SpaceApiClientAuthenticationError):
             await client.async_get_space_state()
 
 
+class TestTimeouts:
+    """Per-request aiohttp timeouts."""
+
+    async def test_fallback_probe_uses_short_connect_timeout(self) -> None:
+        import aiohttp
+
+        session = _mock_session_returning(
+            json_payloads={"https://example.com": {"state": {"open": False}}},
+            raise_for_url={
+                "https://example.com/api/space": aiohttp.ClientError("boom"),
+            },
+        )
+        timeout = aiohttp.ClientTimeout(total=60, sock_connect=8, sock_read=20)
+        client = SpaceApiClient(
+            host_url="https://example.com",
+            session=session,
+            settings=SpaceApiClientSettings(timeout=timeout),
+        )
+        await client.async_get_space_state()
+
+        primary, fallback = (
+            call.kwargs["timeout"] for call in session.request.call_args_list
+        )
+        assert (primary.sock_connect, primary.sock_read) == (8, 20)
+        # The 60 s total is capped to the poll's deadline.
+        assert primary.total == pytest.approx(RETRY_DEADLINE, abs=1)
+        assert fallback.sock_connect == FALLBACK_CONNECT_TIMEOUT
+        assert fallback.sock_read == 20
+        # Both requests share the poll's deadline.
+        assert fallback.total <= primary.total
+
+    async def test_retries_and_fallback_share_one_deadline(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import aiohttp
+
+        from custom_components.spaceapi_endpoint_client import api
+
+        clock = [1000.0]
+        monkeypatch.setattr(api.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(api.random, "uniform", lambda _a, _b: 0)
+
+        async def request(method: str, url: str, **_: object) -> MagicMock:
+            # Every attempt hangs for 6 s before the connection drops.
+            clock[0] += 6
+            msg = "reset"
+            raise aiohttp.ServerDisconnectedError(msg)
+
+        session = MagicMock()
+        session.request = _request_mock(side_effect=request)
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=5, sock_read=10)
+        client = SpaceApiClient(
+            host_url="https://example.com",
+            session=session,
+            endpoint=ENDPOINT_PRIMARY,
+            settings=SpaceApiClientSettings(timeout=timeout),
+        )
+
+        with pytest.raises(SpaceApiClientCommunicationError):
+            await client.async_get_space_state()
+
+        totals = [call.kwargs["timeout"].total for call in session.request.mock_calls]
+        # 15 s for the whole poll: each attempt on /api/space only gets what
+        # is left, and the host URL is not tried once the deadline passed.
+        assert totals == [15, 9, 3]
+
+
+class TestStickyEndpoint:
+    """Read-only clients remember which endpoint serves the space state."""
+
+    @staticmethod
+    def _fallback_only_session() -> MagicMock:
+        import aiohttp
+
+        return _mock_session_returning(
+            json_payloads={"https://example.com": {"state": {"open": False}}},
+            raise_for_url={
+                "https://example.com/api/space": aiohttp.ClientError("boom"),
+            },
+        )
+
+    async def test_goes_straight_to_learned_fallback(self) -> None:
+        session = self._fallback_only_session()
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+
+        await client.async_get_space_state()
+        assert client.endpoint == ENDPOINT_FALLBACK
+        assert session.request.call_count == 2
+
+        await client.async_get_space_state()
+        assert session.request.call_count == 3
+        assert session.request.call_args.kwargs["url"] == "https://example.com"
+
+    async def test_reprobes_primary_with_growing_backoff(self) -> None:
+        session = self._fallback_only_session()
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+        await client.async_get_space_state()
+        first_backoff = client._reprobe_backoff
+
+        client._next_primary_probe = 0.0
+        await client.async_get_space_state()
+        urls = [c.kwargs["url"] for c in session.request.call_args_list[-2:]]
+        assert urls == ["https://example.com/api/space", "https://example.com"]
+        assert client._reprobe_backoff == first_backoff * 2
+
+    async def test_switches_back_when_primary_recovers(self) -> None:
+        session = _mock_session_returning(
+            json_payloads={"https://example.com/api/space": {"state": {"open": True}}}
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com",
+            session=session,
+            endpoint=ENDPOINT_FALLBACK,
+        )
+        client._next_primary_probe = 0.0
+
+        assert await client.async_get_space_state() == {"state": {"open": True}}
+        assert client.endpoint == ENDPOINT_PRIMARY
+
+    async def test_persisted_endpoint_ignored_with_api_key(self) -> None:
+        session = _mock_session_returning()
+        client = SpaceApiClient(
+            host_url="https://example.com",
+            session=session,
+            api_key="abc123",
+            endpoint=ENDPOINT_FALLBACK,
+        )
+        await client.async_get_space_state()
+        assert client.endpoint == ENDPOINT_PRIMARY
+        assert (
+            session.request.call_args.kwargs["url"] == "https://example.com/api/space"
+        )
+
+
+class TestCircuitBreaker:
+    """The client fails fast while a host is down."""
+
+    @staticmethod
+    def _dead_host_session() -> MagicMock:
+        import aiohttp
+
+        return _mock_session_returning(
+            raise_for_url={
+                "https://example.com/api/space": aiohttp.ClientError("down"),
+                "https://example.com": aiohttp.ClientError("down"),
+            },
+        )
+
+    async def _fail(self, client: SpaceApiClient, times: int) -> None:
+        for _ in range(times):
+            with pytest.raises(SpaceApiClientCommunicationError):
+                await client.async_get_space_state()
+
+    async def test_opens_after_threshold_and_fails_fast(self) -> None:
+        session = self._dead_host_session()
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+
+        await self._fail(client, 3)
+        assert client.breaker.state is CircuitState.OPEN
+        requests = session.request.call_count
+
+        with pytest.raises(SpaceApiClientCircuitOpenError):
+            await client.async_get_space_state()
+        assert session.request.call_count == requests
+        assert client.breaker.rejected == 1
+
+    async def test_half_open_trial_failure_doubles_timeout(self) -> None:
+        client = SpaceApiClient(
+            host_url="https://example.com", session=self._dead_host_session()
+        )
+        await self._fail(client, 3)
+        timeout = client.breaker.as_dict()["reset_timeout"]
+
+        client.breaker._retry_at = 0.0
+        assert client.breaker.state is CircuitState.HALF_OPEN
+        await self._fail(client, 1)
+        assert client.breaker.state is CircuitState.OPEN
+        assert client.breaker.as_dict()["reset_timeout"] == timeout * 2
+
+    async def test_half_open_trial_success_closes(self) -> None:
+        import aiohttp
+
+        payloads = {"https://example.com/api/space": {"state": {"open": True}}}
+        down = {"https://example.com/api/space": aiohttp.ClientError("down")}
+        session = _mock_session_returning(json_payloads=payloads, raise_for_url=down)
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+        await self._fail(client, 3)
+
+        down.clear()
+        client.breaker._retry_at = 0.0
+        assert await client.async_get_space_state() == {"state": {"open": True}}
+        assert client.breaker.state is CircuitState.CLOSED
+
+
+class TestEndpointRace:
+    """First contact races /api/space against the direct host URL."""
+
+    async def test_fast_host_url_wins_and_slow_primary_is_cancelled(self) -> None:
+        import asyncio
+
+        cancelled = asyncio.Event()
+
+        async def request(method: str, url: str, **_: object) -> MagicMock:
+            if url == "https://example.com/api/space":
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return _fake_response(200, {"state": {"open": True}})
+
+        session = MagicMock()
+        session.request = _request_mock(side_effect=request)
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+
+        async with asyncio.timeout(5):
+            assert await client.async_get_space_state() == {"state": {"open": True}}
+        assert cancelled.is_set()
+        assert client.endpoint == ENDPOINT_FALLBACK
+
+    async def test_primary_answering_within_stagger_skips_host_url(self) -> None:
+        session = _mock_session_returning(
+            json_payloads={"https://example.com/api/space": {"state": {"open": True}}}
+        )
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+
+        await client.async_get_space_state()
+        assert session.request.call_count == 1
+        assert client.endpoint == ENDPOINT_PRIMARY
+
+    async def test_invalid_document_does_not_win(self) -> None:
+        session = _mock_session_returning(
+            json_payloads={
+                "https://example.com/api/space": {"error": "not here"},
+                "https://example.com": {"state": {"open": False}},
+            }
+        )
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+
+        assert await client.async_get_space_state() == {"state": {"open": False}}
+        assert client.endpoint == ENDPOINT_FALLBACK
+
+    async def test_persisted_endpoint_skips_the_race(self) -> None:
+        session = _mock_session_returning(
+            json_payloads={"https://example.com/api/space": {"error": "not here"}}
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com",
+            session=session,
+            endpoint=ENDPOINT_PRIMARY,
+        )
+
+        assert await client.async_get_space_state() == {"error": "not here"}
+        assert session.request.call_count == 1
+
+
+class TestServerHints:
+    """Cache-Control max-age and Retry-After reach the scheduler."""
+
+    def test_parse_max_age(self) -> None:
+        assert (
+            parse_max_age(CIMultiDict({"Cache-Control": "public, max-age=300"})) == 300
+        )
+        assert (
+            parse_max_age(CIMultiDict({"Cache-Control": "max-age=300", "Age": "100"}))
+            == 200
+        )
+        assert parse_max_age(CIMultiDict({"Cache-Control": "no-cache"})) is None
+        assert parse_max_age(CIMultiDict()) is None
+
+    def test_parse_retry_after(self) -> None:
+        assert parse_retry_after("120") == 120
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    async def test_max_age_is_reported(self) -> None:
+        session = MagicMock()
+        session.request = _request_mock(
+            return_value=_fake_response(
+                200, {"state": {}}, {"Cache-Control": "max-age=300"}
+            )
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        await client.async_get_space_state()
+        assert client.server_hint == 300
+
+    async def test_too_many_requests_reports_retry_after(self) -> None:
+        session = MagicMock()
+        session.request = _request_mock(
+            return_value=_fake_response(429, {}, {"Retry-After": "600"})
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        with pytest.raises(SpaceApiClientRateLimitedError):
+            await client.async_get_space_state()
+        # Not retried, and the host is not counted as down.
+        assert session.request.call_count == 1
+        assert client.server_hint == 600
+        assert client.breaker.state is CircuitState.CLOSED
+
+        session.request = _request_mock(return_value=_fake_response(200, {"state": {}}))
+        await client.async_get_space_state()
+        assert client.server_hint is None
+
+    async def test_read_only_too_many_requests_is_not_lost(self) -> None:
+        session = MagicMock()
+        session.request = _request_mock(
+            return_value=_fake_response(429, {}, {"Retry-After": "600"})
+        )
+        # A learned endpoint polls sequentially: no fallback after a 429.
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, endpoint=ENDPOINT_PRIMARY
+        )
+
+        with pytest.raises(SpaceApiClientRateLimitedError):
+            await client.async_get_space_state()
+        assert session.request.call_count == 1
+        assert client.server_hint == 600
+        assert client.breaker.state is CircuitState.CLOSED
+
+    async def test_read_only_race_keeps_too_many_requests(self) -> None:
+        session = MagicMock()
+        session.request = _request_mock(
+            return_value=_fake_response(429, {}, {"Retry-After": "120"})
+        )
+        # First contact races both endpoints; both answer 429.
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+
+        with pytest.raises(SpaceApiClientRateLimitedError):
+            await client.async_get_space_state()
+        assert client.server_hint == 120
+        assert client.breaker.state is CircuitState.CLOSED
+
+
+class TestResponseRelease:
+    """Every response goes back to the pool, whatever happens to it."""
+
+    async def test_error_response_is_released(self) -> None:
+        response = _fake_response(429, {})
+        session = MagicMock()
+        session.request = _request_mock(return_value=response)
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        with pytest.raises(SpaceApiClientRateLimitedError):
+            await client.async_get_space_state()
+        response.release.assert_called_once()
+
+    async def test_cancelled_body_read_is_released(self) -> None:
+        import asyncio
+
+        reading = asyncio.Event()
+
+        async def iter_chunked(_size: int):
+            reading.set()
+            await asyncio.Event().wait()
+            yield b""
+
+        response = _fake_response(200, {})
+        response.content.iter_chunked = iter_chunked
+        session = MagicMock()
+        session.request = _request_mock(return_value=response)
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        task = asyncio.create_task(client.async_get_space_state())
+        await reading.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        response.release.assert_called_once()
+
+
+class TestRetry:
+    """Idempotent GETs are retried after transient failures."""
+
+    @pytest.fixture(autouse=True)
+    def _no_backoff(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from custom_components.spaceapi_endpoint_client import api
+
+        monkeypatch.setattr(api.random, "uniform", lambda _a, _b: 0)
+
+    @staticmethod
+    def _status(status: int) -> MagicMock:
+        import aiohttp
+
+        response = _fake_response(status, {})
+        response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+            request_info=MagicMock(), history=(), status=status
+        )
+        return response
+
+    async def test_gateway_error_is_retried(self) -> None:
+        session = MagicMock()
+        session.request = _request_mock(
+            side_effect=[self._status(502), _fake_response(200, {"state": {}})]
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        assert await client.async_get_space_state() == {"state": {}}
+        assert session.request.call_count == 2
+        assert client.retry_stats == {"retries": 1, "recovered": 1, "exhausted": 0}
+
+    async def test_connection_reset_gives_up_after_max_attempts(self) -> None:
+        import aiohttp
+
+        session = MagicMock()
+        session.request = _request_mock(
+            side_effect=aiohttp.ServerDisconnectedError("reset")
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        with pytest.raises(SpaceApiClientCommunicationError):
+            await client.async_get_space_state()
+        assert session.request.call_count == RETRY_ATTEMPTS
+        assert client.retry_stats["exhausted"] == 1
+
+    async def test_read_timeout_is_retried(self) -> None:
+        import aiohttp
+
+        session = MagicMock()
+        session.request = _request_mock(
+            side_effect=[
+                aiohttp.SocketTimeoutError("read"),
+                _fake_response(200, {"state": {}}),
+            ]
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        assert await client.async_get_space_state() == {"state": {}}
+        assert session.request.call_count == 2
+
+    async def test_connect_timeout_is_not_retried(self) -> None:
+        import aiohttp
+
+        session = MagicMock()
+        session.request = _request_mock(
+            side_effect=aiohttp.ConnectionTimeoutError("connect")
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        with pytest.raises(SpaceApiClientCommunicationError):
+            await client.async_get_space_state()
+        assert session.request.call_count == 1
+        assert client.retry_stats["retries"] == 0
+
+    async def test_client_errors_are_not_retried(self) -> None:
+        session = MagicMock()
+        session.request = _request_mock(return_value=self._status(404))
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        with pytest.raises(SpaceApiClientCommunicationError):
+            await client.async_get_space_state()
+        assert session.request.call_count == 1
+
+    async def test_post_is_never_retried(self) -> None:
+        session = MagicMock()
+        session.request = _request_mock(return_value=self._status(503))
+        client = SpaceApiClient(
+            host_url="https://example.com", session=session, api_key="abc123"
+        )
+
+        with pytest.raises(SpaceApiClientCommunicationError):
+            await client.async_set_space_state(open_state=True)
+        assert session.request.call_count == 1
+
+
+class TestConditionalGet:
+    """ETag / Last-Modified revalidation of the polled document."""
+
+    @staticmethod
+    def _session(responses: list[tuple[int, dict, dict]]) -> MagicMock:
+        """Fake session that replays (status, headers, payload) in order."""
+        queue = list(responses)
+
+        async def request(method: str, url: str, **_: object) -> MagicMock:
+            status, headers, payload = queue.pop(0)
+            return _fake_response(status, payload, headers)
+
+        session = MagicMock()
+        session.request = _request_mock(side_effect=request)
+        return session
+
+    async def test_sends_validators_and_reuses_payload_on_304(self) -> None:
+        payload = {"state": {"open": True}}
+        session = self._session(
+            [
+                (200, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}, payload),
+                (304, {}, {}),
+            ]
+        )
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+
+        first = await client.async_get_space_state()
+        assert first == payload
+        assert client.not_modified is False
+
+        result = await client.async_get_space_state()
+        assert result is first
+        assert client.not_modified is True
+        headers = session.request.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024"
+        assert client.metrics.not_modified == 1
+        assert client.metrics.decode.total == 1
+        assert client.metrics.bytes_received == len(json.dumps(payload))
+
+    async def test_no_validators_sent_without_cache_headers(self) -> None:
+        session = self._session(
+            [
+                (200, {}, {"state": {"open": True}}),
+                (200, {}, {"state": {"open": False}}),
+            ]
+        )
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+
+        await client.async_get_space_state()
+        assert await client.async_get_space_state() == {"state": {"open": False}}
+        assert session.request.call_args.kwargs["headers"] is None
+        assert client.not_modified is False
+
+
+class TestBoundedRead:
+    """Response size limit and projection of fetched documents."""
+
+    async def test_oversized_body_is_rejected(self) -> None:
+        session = _mock_session_returning(
+            json_payloads={"https://example.com/api/space": {"x": "y" * 100}}
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com",
+            session=session,
+            api_key="abc123",
+            settings=SpaceApiClientSettings(max_response_size=50),
+        )
+        with pytest.raises(SpaceApiClientCommunicationError):
+            await client.async_get_space_state()
+
+    async def test_non_json_body_triggers_fallback(self) -> None:
+        async def request(method: str, url: str, **_: object) -> MagicMock:
+            if url == "https://example.com/api/space":
+                response = _fake_response(200, {})
+                response.content.iter_chunked = lambda _size: _chunks(b"<html>")
+                return response
+            return _fake_response(200, {"state": {"open": True}})
+
+        async def _chunks(*chunks: bytes):
+            for chunk in chunks:
+                yield chunk
+
+        session = MagicMock()
+        session.request = _request_mock(side_effect=request)
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+        assert await client.async_get_space_state() == {"state": {"open": True}}
+
+    async def test_projection_keeps_configured_subtrees(self) -> None:
+        document = {
+            "space": "Test",
+            "state": {"open": True},
+            "sensors": {"temperature": [1], "humidity": [2]},
+            "events": [1, 2, 3],
+        }
+        session = _mock_session_returning(
+            json_payloads={"https://example.com/api/space": document}
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com",
+            session=session,
+            settings=SpaceApiClientSettings(
+                projection=parse_projection("sensors.temperature")
+            ),
+        )
+        assert await client.async_get_space_state() == {
+            "space": "Test",
+            "state": {"open": True},
+            "sensors": {"temperature": [1]},
+        }
+
+    async def test_uses_configured_decoder(self) -> None:
+        calls: list[bytes] = []
+
+        def decoder(body: bytes) -> object:
+            calls.append(body)
+            return json.loads(body)
+
+        session = _mock_session_returning(
+            json_payloads={"https://example.com/api/space": {"state": {"open": True}}}
+        )
+        client = SpaceApiClient(
+            host_url="https://example.com",
+            session=session,
+            settings=SpaceApiClientSettings(decoder=decoder),
+        )
+        assert await client.async_get_space_state() == {"state": {"open": True}}
+        assert len(calls) == 1
+
+    def test_project_document_merges_overlapping_paths(self) -> None:
+        document = {"a": {"b": 1, "c": {"d": 2, "e": 3}}}
+        assert project_document(document, ["a.c.d", "a.b"]) == {
+            "a": {"b": 1, "c": {"d": 2}}
+        }
+        assert project_document(document, ["a", "a.c.d"]) == document
+        assert project_document(document, ["missing.path"]) == {}
+
+    def test_parse_projection_rejects_bad_paths(self) -> None:
+        assert parse_projection(" space , sensors.temperature ,") == (
+            "space",
+            "sensors.temperature",
+        )
+        with pytest.raises(SpaceApiClientError):
+            parse_projection("sensors..temperature")
+
+
+class TestStreamSpaceState:
+    """Server-Sent Events parsing for push mode."""
+
+    async def test_yields_one_document_per_event(self) -> None:
+        lines = [
+            b": keep-alive\n",
+            b"\n",
+            b'data: {"state":\n',
+            b'data: {"open": true}}\n',
+            b"\n",
+            b"event: space\r\n",
+            b'data: {"state": {"open": false}}\r\n',
+            b"\r\n",
+        ]
+
+        async def content():
+            for line in lines:
+                yield line
+
+        response = MagicMock()
+        response.status = 200
+        response.raise_for_status = MagicMock()
+        response.content = content()
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock()
+        session.request = MagicMock(return_value=context)
+
+        client = SpaceApiClient(host_url="https://example.com", session=session)
+        events = [event async for event in client.async_stream_space_state()]
+
+        assert events == [{"state": {"open": True}}, {"state": {"open": False}}]
+        assert (
+            session.request.call_args.kwargs["url"]
+            == "https://example.com/api/space/events"
+        )
+
+
 class TestAsyncSetSpaceState:
     """async_set_space_state."""
 
@@ -156,3 +898,20 @@ class TestAsyncSetSpaceState:
         with pytest.raises(SpaceApiClientError) as excinfo:
             await client.async_set_space_state(open_state=True)
         assert not isinstance(excinfo.value, SpaceApiClientAuthenticationError)
+
+    async def test_non_json_response_is_ignored(self) -> None:
+        # The state is already changed; the caller settles and re-polls.
+        response = _fake_response(200, None)
+
+        async def iter_chunked(_size: int):
+            yield b"OK"
+
+        response.content.iter_chunked = iter_chunked
+        response.content_length = 2
+        session = MagicMock()
+        session.request = _request_mock(return_value=response)
+        client = SpaceApiClient(
+            host_url="https://example.com", api_key="secret", session=session
+        )
+
+        assert await client.async_set_space_state(open_state=True) is None
@@ -14,8 +14,12 @@ from custom_components.spaceapi_endpoint_client.api import (
     SpaceApiClientCommunicationError,
 )
 from custom_components.spaceapi_endpoint_client.const import (
+    CONF_ADAPTIVE_POLLING,
     CONF_API_KEY,
+    CONF_FIELDS,
     CONF_HOST,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
     DOMAIN,
 )
 
@@ -48,6 +52,28 @@ async def test_user_flow_happy_path(
     assert result["data"][CONF_API_KEY] == "abc123"
 
 
+async def test_user_flow_probe_reused_by_first_refresh(
+    hass: HomeAssistant, mock_get_space_state: AsyncMock
+) -> None:
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is data_entry_flow.FlowResultType.CREATE_ENTRY
+    entry = result["result"]
+    assert entry.runtime_data.coordinator.data == {
+        "state": {"open": True},
+        "space": "Test",
+    }
+    # Only the flow's probe went out; the entry setup reused its document.
+    assert mock_get_space_state.await_count == 1
+
+
 async def test_user_flow_invalid_url(
     hass: HomeAssistant,
     mock_get_space_state: AsyncMock,
@@ -178,3 +204,58 @@ async def test_reconfigure_flow_updates_host_and_key(
     assert result["type"] is data_entry_flow.FlowResultType.ABORT
     assert result["reason"] == "reconfigure_successful"
     assert entry.data[CONF_API_KEY] == "abc123"
+
+
+async def test_options_flow_sets_adaptive_polling(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is data_entry_flow.FlowResultType.FORM
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_ADAPTIVE_POLLING: True,
+            CONF_MIN_INTERVAL: 600,
+            CONF_MAX_INTERVAL: 60,
+        },
+    )
+    assert result["type"] is data_entry_flow.FlowResultType.FORM
+    assert result["errors"] == {CONF_MAX_INTERVAL: "invalid_interval_bounds"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_ADAPTIVE_POLLING: True,
+            CONF_MIN_INTERVAL: 30,
+            CONF_MAX_INTERVAL: 1800,
+        },
+    )
+    assert result["type"] is data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_MAX_INTERVAL] == 1800
+
+
+async def test_options_flow_reports_invalid_field_path(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_MIN_INTERVAL: 30,
+            CONF_MAX_INTERVAL: 900,
+            CONF_FIELDS: "$.state.icon.open\nstate..message",
+        },
+    )
+    assert result["type"] is data_entry_flow.FlowResultType.FORM
+    assert result["errors"] == {CONF_FIELDS: "invalid_fields"}
@@ -0,0 +1,284 @@
+"""Tests for the shared host coordinator's polling schedule."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, PropertyMock, patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.spaceapi_endpoint_client.api import (
+    SpaceApiClientCommunicationError,
+)
+from custom_components.spaceapi_endpoint_client.const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_API_KEY,
+    CONF_HOST,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PROJECTION,
+    CONF_PUSH,
+    CONF_STALE_GRACE,
+    DOMAIN,
+    PUSH_SAFETY_INTERVAL,
+)
+from custom_components.spaceapi_endpoint_client.coordinator import (
+    adaptive_interval,
+    phase_aligned_delay,
+    poll_phase,
+)
+
+HINT_PATCH_TARGET = (
+    "custom_components.spaceapi_endpoint_client.api.SpaceApiClient.server_hint"
+)
+STREAM_PATCH_TARGET = (
+    "custom_components.spaceapi_endpoint_client"
+    ".api.SpaceApiClient.async_stream_space_state"
+)
+API_PATCH_TARGET = (
+    "custom_components.spaceapi_endpoint_client"
+    ".api.SpaceApiClient.async_get_space_state"
+)
+
+MIN = timedelta(seconds=30)
+MAX = timedelta(minutes=15)
+
+
+def test_adaptive_interval_starts_at_minimum() -> None:
+    assert adaptive_interval(MIN, MAX, 0, timedelta(0)) == MIN
+
+
+def test_adaptive_interval_doubles_per_unchanged_poll() -> None:
+    assert adaptive_interval(MIN, MAX, 3, timedelta(0)) == MIN * 8
+
+
+def test_adaptive_interval_uses_lastchange() -> None:
+    # Closed for five hours: wait a tenth of that, capped at the maximum.
+    assert adaptive_interval(MIN, MAX, 0, timedelta(hours=5)) == MAX
+    assert adaptive_interval(MIN, MAX, 0, timedelta(minutes=50)) == timedelta(minutes=5)
+
+
+def test_adaptive_interval_is_capped() -> None:
+    assert adaptive_interval(MIN, MAX, 1000, timedelta(0)) == MAX
+
+
+def test_poll_phase_is_stable_and_spread() -> None:
+    phases = [poll_phase(f"https://space{index}.example") for index in range(100)]
+    assert phases[0] == poll_phase("https://space0.example")
+    assert all(0 <= phase < 1 for phase in phases)
+    # Every tenth of the interval holds some of the hosts.
+    assert {int(phase * 10) for phase in phases} == set(range(10))
+
+
+def test_phase_aligned_delay_lands_on_the_slot() -> None:
+    for now in (0.0, 17.5, 1000.25):
+        delay = phase_aligned_delay(now, 60, 0.25)
+        assert (now + delay) % 60 == 15
+        assert 30 <= delay <= 90
+
+
+def test_phase_aligned_delay_keeps_a_host_in_its_slot() -> None:
+    assert phase_aligned_delay(15, 60, 0.25) == 60
+
+
+async def test_failed_polls_serve_last_good_data_within_grace(
+    hass: HomeAssistant,
+) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        options={CONF_STALE_GRACE: 120},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value={"state": {"open": True}})):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    (entity_id,) = hass.states.async_entity_ids("binary_sensor")
+    coordinator = entry.runtime_data.coordinator
+
+    failing = AsyncMock(side_effect=SpaceApiClientCommunicationError("down"))
+    with patch(API_PATCH_TARGET, failing):
+        await entry.runtime_data.host_coordinator.async_refresh()
+        await hass.async_block_till_done()
+        assert hass.states.get(entity_id).state == "on"
+        assert coordinator.stale_since is not None
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=121))
+        await hass.async_block_till_done()
+        assert hass.states.get(entity_id).state == "unavailable"
+
+    with patch(API_PATCH_TARGET, AsyncMock(return_value={"state": {"open": True}})):
+        await entry.runtime_data.host_coordinator.async_refresh()
+        await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "on"
+    assert coordinator.stale_since is None
+
+
+async def test_server_hint_delays_next_poll_within_bounds(
+    hass: HomeAssistant,
+) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        options={CONF_MAX_INTERVAL: 600},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    with (
+        patch(API_PATCH_TARGET, AsyncMock(return_value={"state": {"open": True}})),
+        patch(HINT_PATCH_TARGET, new_callable=PropertyMock) as hint,
+    ):
+        hint.return_value = 300
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        host_coordinator = entry.runtime_data.host_coordinator
+        assert host_coordinator.update_interval == timedelta(seconds=300)
+
+        # Retry-After of an hour: capped at the configured maximum interval.
+        hint.return_value = 3600
+        await host_coordinator.async_refresh()
+        assert host_coordinator.update_interval == timedelta(seconds=600)
+
+        # A hint shorter than the interval does not make us poll sooner.
+        hint.return_value = 5
+        await host_coordinator.async_refresh()
+        assert host_coordinator.update_interval >= timedelta(seconds=30)
+
+
+async def test_push_mode_starts_stream_and_applies_events(
+    hass: HomeAssistant,
+) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        options={CONF_PUSH: True},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    pushed = asyncio.Event()
+
+    async def stream(_client: object):
+        yield {"space": "Test", "state": {"open": False}}
+        pushed.set()
+        # Keep the stream open until the entry is unloaded.
+        await asyncio.Event().wait()
+
+    with (
+        patch(API_PATCH_TARGET, AsyncMock(return_value={"state": {"open": True}})),
+        patch(STREAM_PATCH_TARGET, stream),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        await asyncio.wait_for(pushed.wait(), 1)
+
+        host_coordinator = entry.runtime_data.host_coordinator
+        assert host_coordinator.push_connected
+        assert host_coordinator.data["state"]["open"] is False
+        assert host_coordinator.poll_interval == PUSH_SAFETY_INTERVAL
+        (entity_id,) = hass.states.async_entity_ids("binary_sensor")
+        assert hass.states.get(entity_id).state == "off"
+
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+
+async def test_local_action_tightens_the_scheduled_poll(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: "abc123"},
+        options={
+            CONF_ADAPTIVE_POLLING: True,
+            CONF_MIN_INTERVAL: 30,
+            CONF_MAX_INTERVAL: 900,
+        },
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value={"state": {"open": True}})):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    host_coordinator = entry.runtime_data.host_coordinator
+    host_coordinator.poll_interval = timedelta(seconds=900)
+    host_coordinator.update_interval = timedelta(seconds=900)
+
+    entry.runtime_data.coordinator.async_note_local_action()
+
+    assert host_coordinator.poll_interval == timedelta(seconds=30)
+    # Within half an interval of the minimum, on the host's slot.
+    assert host_coordinator.update_interval <= timedelta(seconds=45)
+
+
+async def test_polling_client_returns_to_its_projection(hass: HomeAssistant) -> None:
+    narrow = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        options={CONF_PROJECTION: "sensors.temperature"},
+        unique_id="https-example-com",
+    )
+    keep_all = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com:443/", CONF_API_KEY: ""},
+        unique_id="https-example-com-443",
+    )
+    narrow.add_to_hass(hass)
+    keep_all.add_to_hass(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value={"state": {"open": True}})):
+        # Setting up the component loads every entry of the domain.
+        assert await hass.config_entries.async_setup(narrow.entry_id)
+        await hass.async_block_till_done()
+        host_coordinator = narrow.runtime_data.host_coordinator
+        client = narrow.runtime_data.client
+
+        await host_coordinator.async_refresh()
+        assert client.projection == ()
+
+        # Once the entry keeping everything is gone, polls shrink again.
+        assert await hass.config_entries.async_unload(keep_all.entry_id)
+        await host_coordinator.async_refresh()
+        assert client.projection == ("sensors.temperature", "space", "state")
+
+
+async def test_server_sent_documents_are_projected(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        options={CONF_PROJECTION: "sensors.temperature"},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value={"state": {"open": False}})):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    # As delivered by the push stream, the webhook or a POST response.
+    assert entry.runtime_data.host_coordinator.async_apply_server_state(
+        {
+            "space": "Test Hackerspace",
+            "state": {"open": True},
+            "contact": {"email": "info@example.com"},
+            "sensors": {"temperature": [], "humidity": []},
+        }
+    )
+    await hass.async_block_till_done()
+
+    expected = {
+        "space": "Test Hackerspace",
+        "state": {"open": True},
+        "sensors": {"temperature": []},
+    }
+    assert entry.runtime_data.coordinator.data == expected
+    assert entry.runtime_data.store.payload("https://example.com") == expected
@@ -0,0 +1,47 @@
+"""Tests for the parsed SpaceState model."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.spaceapi_endpoint_client.data import SpaceState
+
+
+def test_from_document_parses_entity_fields() -> None:
+    state = SpaceState.from_document(
+        {
+            "space": "Test Hackerspace",
+            "state": {
+                "open": True,
+                "lastchange": 1700000000,
+                "message": "Open for everyone",
+                "trigger_person": "alice",
+            },
+            "sensors": {"people_now_present": [{"value": 2}, {"value": 3}]},
+        }
+    )
+    assert state.space == "Test Hackerspace"
+    assert state.open is True
+    assert state.lastchange == 1700000000
+    assert state.message == "Open for everyone"
+    assert state.trigger_person == "alice"
+    assert state.people_now_present == 5
+
+
+@pytest.mark.parametrize(
+    "document",
+    [None, [], {"state": "open"}, {"space": "  ", "state": {"lastchange": "x"}}],
+)
+def test_from_document_tolerates_malformed_documents(document: object) -> None:
+    state = SpaceState.from_document(document)
+    assert state.open is False
+    assert state.space is None
+    assert state.lastchange is None
+
+
+def test_is_immutable_and_compares_by_value() -> None:
+    document = {"state": {"open": True}}
+    state = SpaceState.from_document(document)
+    assert state == SpaceState.from_document({"state": {"open": True}})
+    with pytest.raises(AttributeError):
+        state.open = False  # type: ignore[misc]
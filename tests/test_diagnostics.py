@@ -0,0 +1,78 @@
+"""Tests for the config entry diagnostics."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.spaceapi_endpoint_client.const import (
+    CONF_API_KEY,
+    CONF_HOST,
+    DOMAIN,
+)
+from custom_components.spaceapi_endpoint_client.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+API_PATCH_TARGET = (
+    "custom_components.spaceapi_endpoint_client"
+    ".api.SpaceApiClient.async_get_space_state"
+)
+
+
+async def test_diagnostics_redacts_key_and_reports_breaker(
+    hass: HomeAssistant,
+) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: "secret123"},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value={"state": {"open": True}})):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"][CONF_API_KEY] == REDACTED
+    assert diagnostics["host"]["circuit_breaker"]["state"] == "closed"
+    assert diagnostics["host"]["retries"]["exhausted"] == 0
+    assert diagnostics["host"]["entries"] == 1
+    assert diagnostics["metrics"]["latency"]["ttfb"]["count"] == 0
+
+
+async def test_diagnostics_report_the_polling_client_of_a_shared_host(
+    hass: HomeAssistant,
+) -> None:
+    keyed = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: "secret123"},
+        unique_id="https-example-com",
+    )
+    read_only = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com:443/", CONF_API_KEY: ""},
+        unique_id="https-example-com-443",
+    )
+    keyed.add_to_hass(hass)
+    read_only.add_to_hass(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value={"state": {"open": True}})):
+        # Setting up the component loads every entry of the domain.
+        assert await hass.config_entries.async_setup(keyed.entry_id)
+        await hass.async_block_till_done()
+
+    # The entry with a key performs the shared poll.
+    keyed.runtime_data.metrics.requests = 7
+    keyed.runtime_data.client.retry_stats["retries"] = 2
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, read_only)
+
+    assert diagnostics["metrics"]["requests"] == 7
+    assert diagnostics["host"]["retries"]["retries"] == 2
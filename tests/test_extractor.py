@@ -0,0 +1,56 @@
+"""Tests for the user-defined field extractors."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.spaceapi_endpoint_client.api import SpaceApiClientError
+from custom_components.spaceapi_endpoint_client.extractor import (
+    compile_extractor,
+    parse_extractors,
+    state_value,
+)
+
+DOCUMENT = {
+    "space": "Test Hackerspace",
+    "state": {"open": True, "icon": {"open": "https://example.org/open.png"}},
+    "ext_ccc": {"rooms": [{"name": "Lab", "temperature": 21.5}]},
+}
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("$.state.icon.open", "https://example.org/open.png"),
+        ("state.open", True),
+        ("ext_ccc.rooms[0].temperature", 21.5),
+        ("ext_ccc.rooms[1].temperature", None),
+        ("state.missing", None),
+        ("space.length", None),
+    ],
+)
+def test_compiled_accessor_reads_field(path: str, expected: object) -> None:
+    assert compile_extractor(path).get(DOCUMENT) == expected
+
+
+def test_projection_path_stops_at_first_list() -> None:
+    assert compile_extractor("ext_ccc.rooms[0].temperature").projection_path == (
+        "ext_ccc.rooms"
+    )
+    assert compile_extractor("$.state.icon.open").projection_path == "state.icon.open"
+
+
+def test_parse_extractors_reports_every_invalid_path() -> None:
+    with pytest.raises(SpaceApiClientError, match=r"state\.\.open, a\[x\]"):
+        parse_extractors("state.open\nstate..open, a[x]")
+    assert [e.key for e in parse_extractors("state.open,\n ext_ccc.rooms[0]\n")] == [
+        "state_open",
+        "ext_ccc_rooms_0",
+    ]
+
+
+def test_state_value_normalizes_scalars() -> None:
+    assert state_value(value=True) == "true"
+    assert state_value(3) == 3
+    assert state_value("x" * 300) == "x" * 255
+    assert state_value({"a": 1}) is None
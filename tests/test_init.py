@@ -2,17 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.spaceapi_endpoint_client.api import (
+    SpaceApiClientAuthenticationError,
+)
 from custom_components.spaceapi_endpoint_client.const import (
     CONF_API_KEY,
     CONF_HOST,
     DOMAIN,
 )
+from custom_components.spaceapi_endpoint_client.coordinator import (
+    DATA_HOST_COORDINATORS,
+)
+from custom_components.spaceapi_endpoint_client.session import DATA_SESSION
 
 API_PATCH_TARGET = (
     "custom_components.spaceapi_endpoint_client"
@@ -80,3 +88,136 @@ async def test_migration_v1_to_v2_sanitizes_data(
     assert migrated is not None
     assert migrated.version == 2
     assert migrated.data[CONF_HOST] == "https://example.com"
+
+
+async def test_learned_endpoint_is_restored_from_storage(
+    hass: HomeAssistant, hass_storage: dict, fake_space_state: dict
+) -> None:
+    entry = _make_entry(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {"host": "https://example.com", "endpoint": "fallback"},
+    }
+    with patch(API_PATCH_TARGET, AsyncMock(return_value=fake_space_state)):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.runtime_data.client.endpoint == "fallback"
+
+
+async def test_startup_seeds_from_persisted_payload_without_waiting(
+    hass: HomeAssistant, hass_storage: dict
+) -> None:
+    entry = _make_entry(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {
+            "host": "https://example.com",
+            "payload": {"state": {"open": True}, "space": "Test Hackerspace"},
+        },
+    }
+    release = asyncio.Event()
+
+    async def slow_fetch(*_: object) -> dict:
+        await release.wait()
+        return {"state": {"open": False}, "space": "Test Hackerspace"}
+
+    with patch(API_PATCH_TARGET, side_effect=slow_fetch):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        (entity_id,) = hass.states.async_entity_ids("binary_sensor")
+        assert hass.states.get(entity_id).state == "on"
+
+        release.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert hass.states.get(entity_id).state == "off"
+
+
+async def test_entries_for_same_host_share_one_poller(
+    hass: HomeAssistant, fake_space_state: dict
+) -> None:
+    first = _make_entry(hass)
+    second = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://EXAMPLE.com:443/", CONF_API_KEY: "secret123"},
+        unique_id="https-example-com-443",
+    )
+    second.add_to_hass(hass)
+
+    mock = AsyncMock(return_value=fake_space_state)
+    with patch(API_PATCH_TARGET, mock):
+        # Setting up the component loads every entry of the domain.
+        assert await hass.config_entries.async_setup(first.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock.await_count == 1
+    host_coordinator = first.runtime_data.host_coordinator
+    assert second.runtime_data.host_coordinator is host_coordinator
+    assert second.runtime_data.coordinator.data == fake_space_state
+    session = first.runtime_data.client._session
+    assert second.runtime_data.client._session is session
+
+    assert await hass.config_entries.async_unload(first.entry_id)
+    assert hass.data[DATA_HOST_COORDINATORS] == {
+        host_coordinator.host_key: host_coordinator
+    }
+    assert not session.closed
+    assert await hass.config_entries.async_unload(second.entry_id)
+    assert hass.data[DATA_HOST_COORDINATORS] == {}
+    assert session.closed
+    assert DATA_SESSION not in hass.data
+
+
+async def test_rejected_key_reauths_only_the_polling_entry(
+    hass: HomeAssistant, fake_space_state: dict
+) -> None:
+    read_only = _make_entry(hass)
+    keyed = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com/", CONF_API_KEY: "secret123"},
+        unique_id="https-example-com-keyed",
+    )
+    keyed.add_to_hass(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value=fake_space_state)):
+        assert await hass.config_entries.async_setup(read_only.entry_id)
+        await hass.async_block_till_done()
+
+    host_coordinator = keyed.runtime_data.host_coordinator
+    with patch(
+        API_PATCH_TARGET,
+        AsyncMock(side_effect=SpaceApiClientAuthenticationError("bad key")),
+    ):
+        await host_coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert host_coordinator.auth_failed_entry is keyed
+    flows = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    assert [flow["context"]["entry_id"] for flow in flows] == [keyed.entry_id]
+
+
+async def test_unchanged_update_skips_state_write(
+    hass: HomeAssistant, fake_space_state: dict
+) -> None:
+    entry = _make_entry(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value=fake_space_state)):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    (entity_id,) = hass.states.async_entity_ids("binary_sensor")
+    before = hass.states.get(entity_id)
+
+    # Same content, different object: nothing the entity shows changed.
+    entry.runtime_data.coordinator.async_set_updated_data(
+        {**fake_space_state, "contact": {"email": "new@example.com"}}
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).last_reported == before.last_reported
+
+    entry.runtime_data.coordinator.async_set_updated_data(
+        {**fake_space_state, "state": {"open": True}}
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "on"
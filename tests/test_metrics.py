@@ -0,0 +1,71 @@
+"""Tests for the request metrics."""
+
+from __future__ import annotations
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.spaceapi_endpoint_client.metrics import (
+    HEALTH_WINDOW,
+    LATENCY_BUCKETS_MS,
+    LatencyHistogram,
+    SpaceApiMetrics,
+    create_trace_config,
+)
+
+
+def test_histogram_uses_fixed_buckets() -> None:
+    histogram = LatencyHistogram()
+    for seconds in (0.001, 0.005, 0.2, 60):
+        histogram.observe(seconds)
+
+    summary = histogram.as_dict()
+    assert summary["count"] == 4
+    assert summary["max_ms"] == 60000
+    assert summary["buckets"]["<= 5 ms"] == 2
+    assert summary["buckets"]["<= 250 ms"] == 1
+    assert summary["buckets"]["> 10000 ms"] == 1
+    assert len(histogram.counts) == len(LATENCY_BUCKETS_MS) + 1
+
+
+def test_poll_health_covers_a_rolling_window() -> None:
+    metrics = SpaceApiMetrics()
+    assert metrics.success_ratio is None
+    assert metrics.p95_poll_latency is None
+
+    metrics.record_poll(success=False, seconds=0.0)
+    for index in range(1, HEALTH_WINDOW + 1):
+        metrics.record_poll(success=True, seconds=index / 100)
+
+    # The failure has left the window.
+    assert metrics.success_ratio == 1
+    assert metrics.p95_poll_latency == 0.19
+    assert metrics.last_poll_latency == 0.2
+
+
+# The plugin blocks sockets; the trace callbacks need a real connection.
+@pytest.mark.usefixtures("socket_enabled")
+async def test_trace_config_times_opted_in_requests() -> None:
+    async def space(_request: web.Request) -> web.Response:
+        return web.json_response({"state": {"open": True}})
+
+    app = web.Application()
+    app.router.add_get("/api/space", space)
+    metrics = SpaceApiMetrics()
+    async with (
+        TestServer(app) as server,
+        aiohttp.ClientSession(trace_configs=[create_trace_config()]) as session,
+    ):
+        url = server.make_url("/api/space")
+        for _ in range(2):
+            async with session.get(url, trace_request_ctx=metrics) as response:
+                await response.read()
+        # Requests without metrics are not recorded.
+        async with session.get(url) as response:
+            await response.read()
+
+    assert metrics.ttfb.total == 2
+    assert metrics.connect.total == 1
+    assert metrics.reused_connections == 1
@@ -0,0 +1,168 @@
+"""Tests for the SpaceAPI sensor platform."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.components.sensor import ATTR_STATE_CLASS, SensorStateClass
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, UnitOfTemperature
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.spaceapi_endpoint_client.const import (
+    CONF_API_KEY,
+    CONF_FIELDS,
+    CONF_HOST,
+    DOMAIN,
+)
+from custom_components.spaceapi_endpoint_client.sensor import parse_readings
+
+API_PATCH_TARGET = (
+    "custom_components.spaceapi_endpoint_client"
+    ".api.SpaceApiClient.async_get_space_state"
+)
+
+
+def _document(temperature: float, people: int) -> dict:
+    return {
+        "space": "Test Hackerspace",
+        "state": {"open": True},
+        "sensors": {
+            "temperature": [{"value": temperature, "unit": "°C", "location": "Lab"}],
+            "people_now_present": [{"value": people}],
+            "door_locked": [{"value": True}],
+        },
+    }
+
+
+def test_parse_readings_flattens_nested_sensors() -> None:
+    readings = parse_readings(
+        {
+            "temperature": [{"value": 21.5, "unit": "°C", "location": "Lab"}],
+            "radiation": {"beta": [{"value": 0.1, "unit": "µSv/h"}]},
+            "wind": [
+                {
+                    "location": "Roof",
+                    "properties": {"speed": {"value": 3, "unit": "m/s"}},
+                }
+            ],
+            "door_locked": [{"value": True}],
+            "humidity": [{"value": "high"}],
+        }
+    )
+    assert set(readings) == {"temperature_lab", "radiation_beta_0", "wind_roof_speed"}
+    assert readings["temperature_lab"].name == "Temperature Lab"
+    assert readings["wind_roof_speed"].value == 3
+
+
+async def test_sensors_created_and_only_changed_ones_written(
+    hass: HomeAssistant,
+) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value=_document(21.5, 2))):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    entity_ids = sorted(hass.states.async_entity_ids("sensor"))
+    assert len(entity_ids) == 2
+    temperature_id, people_id = (
+        next(e for e in entity_ids if "temperature" in e),
+        next(e for e in entity_ids if "people" in e),
+    )
+    temperature = hass.states.get(temperature_id)
+    assert temperature.state == "21.5"
+    assert temperature.attributes[ATTR_STATE_CLASS] == SensorStateClass.MEASUREMENT
+    assert temperature.attributes[ATTR_UNIT_OF_MEASUREMENT] == UnitOfTemperature.CELSIUS
+    people_before = hass.states.get(people_id)
+
+    entry.runtime_data.coordinator.async_set_updated_data(_document(22.0, 2))
+    await hass.async_block_till_done()
+
+    assert hass.states.get(temperature_id).state == "22.0"
+    assert hass.states.get(people_id).last_reported == people_before.last_reported
+
+
+async def test_field_extractors_create_sensors(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        options={CONF_FIELDS: "$.state.message\next.missing"},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    document = _document(21.5, 2)
+    document["state"]["message"] = "Open house"
+    with patch(API_PATCH_TARGET, AsyncMock(return_value=document)):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    states = {
+        state.name: state.state
+        for state in hass.states.async_all("sensor")
+        if ATTR_STATE_CLASS not in state.attributes
+    }
+    assert states == {"$.state.message": "Open house", "ext.missing": "unavailable"}
+
+
+async def test_health_sensors_disabled_by_default(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value=_document(21.5, 2))):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_poll_success_ratio"
+    )
+    assert (
+        registry.async_get(entity_id).disabled_by
+        is er.RegistryEntryDisabler.INTEGRATION
+    )
+    assert hass.states.get(entity_id) is None
+
+
+async def test_health_sensors_follow_every_poll(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    # Registry entries created up front, enabled, override the default.
+    registry = er.async_get(hass)
+    ratio_id, endpoint_id = (
+        registry.async_get_or_create(
+            "sensor", DOMAIN, f"{entry.entry_id}_{key}", config_entry=entry
+        ).entity_id
+        for key in ("poll_success_ratio", "endpoint")
+    )
+    document = _document(21.5, 2)
+    with patch(API_PATCH_TARGET, AsyncMock(return_value=document)):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert hass.states.get(endpoint_id).state == "primary"
+
+        # An unchanged document skips the coordinator listeners, but the
+        # health sensors still see the poll.
+        metrics = entry.runtime_data.metrics
+        metrics.record_poll(success=True, seconds=0.05)
+        metrics.record_poll(success=False, seconds=0.0)
+        await entry.runtime_data.host_coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert hass.states.get(ratio_id).state == "50.0"
@@ -0,0 +1,111 @@
+"""Tests for the space status switch."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.spaceapi_endpoint_client.const import (
+    CONF_API_KEY,
+    CONF_HOST,
+    DOMAIN,
+)
+
+CLIENT = "custom_components.spaceapi_endpoint_client.api.SpaceApiClient"
+
+
+async def _setup(hass: HomeAssistant, get_mock: AsyncMock) -> str:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: "secret123"},
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    with patch(f"{CLIENT}.async_get_space_state", get_mock):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    (entity_id,) = hass.states.async_entity_ids("switch")
+    return entity_id
+
+
+async def test_turn_on_uses_post_response_without_refetch(
+    hass: HomeAssistant,
+) -> None:
+    get_mock = AsyncMock(return_value={"state": {"open": False}, "space": "Test"})
+    entity_id = await _setup(hass, get_mock)
+
+    with (
+        patch(f"{CLIENT}.async_get_space_state", get_mock),
+        patch(
+            f"{CLIENT}.async_set_space_state",
+            AsyncMock(return_value={"open": True, "message": "Space was switched on"}),
+        ),
+    ):
+        await hass.services.async_call(
+            "switch", "turn_on", {"entity_id": entity_id}, blocking=True
+        )
+
+    assert get_mock.await_count == 1
+    assert hass.states.get(entity_id).state == "on"
+
+
+async def test_turn_on_falls_back_to_refresh_on_empty_response(
+    hass: HomeAssistant,
+) -> None:
+    get_mock = AsyncMock(return_value={"state": {"open": False}, "space": "Test"})
+    entity_id = await _setup(hass, get_mock)
+    get_mock.return_value = {"state": {"open": True}, "space": "Test"}
+
+    with (
+        patch(f"{CLIENT}.async_get_space_state", get_mock),
+        patch(f"{CLIENT}.async_set_space_state", AsyncMock(return_value=None)),
+        patch("custom_components.spaceapi_endpoint_client.switch.API_SETTLE_DELAY", 0),
+    ):
+        await hass.services.async_call(
+            "switch", "turn_on", {"entity_id": entity_id}, blocking=True
+        )
+
+    assert get_mock.await_count == 2
+    assert hass.states.get(entity_id).state == "on"
+
+
+async def test_rapid_commands_coalesce_to_latest(hass: HomeAssistant) -> None:
+    get_mock = AsyncMock(return_value={"state": {"open": False}, "space": "Test"})
+    entity_id = await _setup(hass, get_mock)
+
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_post(*, open_state: bool) -> dict:
+        started.set()
+        await release.wait()
+        return {"open": open_state}
+
+    set_mock = AsyncMock(side_effect=slow_post)
+    with (
+        patch(f"{CLIENT}.async_get_space_state", get_mock),
+        patch(f"{CLIENT}.async_set_space_state", set_mock),
+    ):
+        first = hass.async_create_task(
+            hass.services.async_call(
+                "switch", "turn_on", {"entity_id": entity_id}, blocking=True
+            )
+        )
+        await started.wait()
+        for service in ("turn_off", "turn_on", "turn_off"):
+            await hass.services.async_call(
+                "switch", service, {"entity_id": entity_id}, blocking=True
+            )
+        release.set()
+        await first
+
+    # The in-flight "on" plus only the newest queued command.
+    assert [c.kwargs["open_state"] for c in set_mock.await_args_list] == [
+        True,
+        False,
+    ]
+    assert hass.states.get(entity_id).state == "off"
@@ -0,0 +1,85 @@
+"""Tests for the inbound webhook."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.spaceapi_endpoint_client.const import (
+    CONF_API_KEY,
+    CONF_HOST,
+    CONF_WEBHOOK,
+    CONF_WEBHOOK_ID,
+    CONF_WEBHOOK_SECRET,
+    DOMAIN,
+    WEBHOOK_SECRET_HEADER,
+)
+
+API_PATCH_TARGET = (
+    "custom_components.spaceapi_endpoint_client"
+    ".api.SpaceApiClient.async_get_space_state"
+)
+
+
+@pytest.fixture
+async def webhook_entry(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={CONF_HOST: "https://example.com", CONF_API_KEY: ""},
+        options={
+            CONF_WEBHOOK: True,
+            CONF_WEBHOOK_ID: "spaceapi_hook",
+            CONF_WEBHOOK_SECRET: "s3cret",
+        },
+        unique_id="https-example-com",
+    )
+    entry.add_to_hass(hass)
+    with patch(
+        API_PATCH_TARGET,
+        AsyncMock(return_value={"state": {"open": False}, "space": "Test"}),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return entry
+
+
+async def test_webhook_pushes_state(
+    hass: HomeAssistant, hass_client_no_auth, webhook_entry: MockConfigEntry
+) -> None:
+    client = await hass_client_no_auth()
+    response = await client.post(
+        "/api/webhook/spaceapi_hook",
+        json={"state": {"open": True}, "space": "Test"},
+        headers={WEBHOOK_SECRET_HEADER: "s3cret"},
+    )
+    assert response.status == HTTPStatus.NO_CONTENT
+    await hass.async_block_till_done()
+
+    assert webhook_entry.runtime_data.coordinator.data["state"]["open"] is True
+    (entity_id,) = hass.states.async_entity_ids("binary_sensor")
+    assert hass.states.get(entity_id).state == "on"
+
+
+async def test_webhook_rejects_bad_secret_and_payload(
+    hass: HomeAssistant, hass_client_no_auth, webhook_entry: MockConfigEntry
+) -> None:
+    client = await hass_client_no_auth()
+    response = await client.post(
+        "/api/webhook/spaceapi_hook",
+        json={"state": {"open": True}},
+        headers={WEBHOOK_SECRET_HEADER: "wrong"},
+    )
+    assert response.status == HTTPStatus.UNAUTHORIZED
+
+    response = await client.post(
+        "/api/webhook/spaceapi_hook",
+        json={"state": {"open": "yes"}},
+        headers={WEBHOOK_SECRET_HEADER: "s3cret"},
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+    assert webhook_entry.runtime_data.coordinator.data["state"]["open"] is False